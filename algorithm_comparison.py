@@ -4,6 +4,11 @@
 # by running them on the same set of processes and displaying comparative results.
 # It helps visualize the trade-offs between different scheduling approaches.
 
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
 from tabulate import tabulate
 from algorithms.fcfs import fcfs_schedule
 from algorithms.priority_non_preemptive import priority_schedule
@@ -11,14 +16,62 @@ from algorithms.priority_preemptive import priority_preemptive_schedule
 from algorithms.sjf import sjf
 from algorithms.round_robin import round_robin
 from algorithms.priority_rr import priority_round_robin
-import copy
+from process_table import COLUMNS, ProcessTable
+from result_cache import CachedRun, result_cache, workload_digest
 from textwrap import shorten
 
+# Below this many processes the pool start-up costs more than it saves
+PARALLEL_MIN_PROCESSES = 10_000
+
+
+def _run_one(columns, algo_name, algo_fn, quantum):
+    """
+    Run one algorithm on a fresh ProcessTable over the shared input columns.
+
+    Args:
+        columns: (pid, arrival_time, burst_time, priority) int64 arrays, read-only
+        algo_name, algo_fn: Entry from AlgorithmComparison.algorithms
+        quantum: Time quantum for the Round-Robin algorithms (or None)
+
+    Returns:
+        (table, metrics, wall_time) with wall_time in seconds
+    """
+    table = ProcessTable(*columns)
+    started = time.perf_counter()
+    # Only the metrics are compared, so skip the timeline
+    if "Round-Robin" in algo_name and quantum is not None:
+        _, _, metrics = algo_fn(table, quantum, metrics_only=True)
+    else:
+        _, _, metrics = algo_fn(table, metrics_only=True)
+    return table, metrics, time.perf_counter() - started
+
+
+# Worker-side view of the workload, set up once per pool process
+_worker_workload = None
+
+
+def _attach_workload(shm_name, n):
+    """Pool initializer: map the parent's shared workload block without copying it."""
+    global _worker_workload
+    shm = shared_memory.SharedMemory(name=shm_name)
+    table = ProcessTable.from_shared_memory(shm, n)
+    columns = (table.pid, table.arrival_time, table.burst_time, table.priority)
+    _worker_workload = (shm, columns)   # keep the mapping alive with the views
+
+
+def _run_in_worker(algo_name, algo_fn, quantum):
+    """Pool task: run one algorithm and send back only the result columns."""
+    table, metrics, wall_time = _run_one(_worker_workload[1], algo_name, algo_fn, quantum)
+    return {name: getattr(table, name) for name in COLUMNS[4:]}, metrics, wall_time
+
 
 class AlgorithmComparison:
     """Class for comparing different CPU scheduling algorithms"""
     
-    def __init__(self):
+    def __init__(self, cache=result_cache):
+        # ResultCache consulted before running anything (None to always recompute)
+        self.cache = cache
+        
         # Dictionary mapping algorithm keys to (name, function) pairs
         self.algorithms = {
             "1": ("FCFS", fcfs_schedule),
@@ -93,23 +146,76 @@ class AlgorithmComparison:
         
         return None  # No quantum needed
     
-    def run_comparison(self, processes, selected_algorithms, quantum=None, color=None):
-        """Run all selected algorithms and collect results"""
+    def run_comparison(self, processes, selected_algorithms, quantum=None, color=None, workers=None):
+        """
+        Run all selected algorithms and collect results.
+
+        Runs found in the result cache are reused; the rest are simulated and
+        cached. Large workloads are run concurrently, one algorithm per pool process.
+        The workload is copied once into a shared-memory block of int64
+        columns that every worker maps read-only, so no Process objects are
+        pickled; each worker sends back only its result columns and metrics.
+
+        Args:
+            processes: List of Process / ProcessSpec objects, or a ProcessTable
+            workers: Pool size (default: one per algorithm, capped at the CPU
+                count); 1 runs everything in this process
+
+        Returns:
+            {algo_id: {'name', 'processes' (ProcessTable), 'schedule' (None),
+            'metrics', 'wall_time' (seconds; None when served from the cache)}}
+            in selection order
+        """
         results = {}
         
+        # One read-only workload shared by every run: each algorithm fills in
+        # its own result columns, so nothing needs copying
+        if not isinstance(processes, ProcessTable):
+            processes = ProcessTable.from_specs(processes)
+        columns = (processes.pid, processes.arrival_time, processes.burst_time, processes.priority)
+        
         print(f"\n{color.CYAN}{color.BOLD}{'═' * 5} Running Algorithms {'═' * 35}{color.RESET}")
         
+        # Serve what we can from the cache
+        runs = {}
+        keys = {}
+        pending = []
+        digest = workload_digest(processes) if self.cache is not None else None
         for algo_id, algo_name, algo_fn in selected_algorithms:
-            # Create a deep copy of processes to avoid modifying the original
-            process_copy = copy.deepcopy(processes)
-            
-            print(f"  {color.CYAN}•{color.RESET} Processing {color.BOLD}{algo_name}{color.RESET}...")
-            
-            # Run the algorithm
-            if "Round-Robin" in algo_name and quantum is not None:
-                result_processes, schedule, metrics = algo_fn(process_copy, quantum)
-            else:
-                result_processes, schedule, metrics = algo_fn(process_copy)
+            if self.cache is None:
+                pending.append((algo_id, algo_name, algo_fn))
+                continue
+            algo_quantum = quantum if "Round-Robin" in algo_name else None
+            keys[algo_id] = self.cache.key(algo_fn, digest, algo_quantum, table=True)
+            entry = self.cache.get(keys[algo_id])
+            if entry is None:
+                pending.append((algo_id, algo_name, algo_fn))
+                continue
+            table, _, metrics = entry.apply(ProcessTable(*columns))
+            # A lookup time is not a run time: cached runs get none
+            runs[algo_id] = (table, metrics, None)
+            print(f"  {color.CYAN}•{color.RESET} {color.BOLD}{algo_name}{color.RESET}: {color.GREEN}✓{color.RESET} cached")
+        
+        if workers is None:
+            workers = min(len(pending), os.cpu_count() or 1)
+        parallel = workers > 1 and len(processes) >= PARALLEL_MIN_PROCESSES
+        
+        if parallel:
+            fresh = self._run_parallel(processes, pending, quantum, workers, color)
+        else:
+            fresh = {}
+            for algo_id, algo_name, algo_fn in pending:
+                print(f"  {color.CYAN}•{color.RESET} Processing {color.BOLD}{algo_name}{color.RESET}...")
+                fresh[algo_id] = _run_one(columns, algo_name, algo_fn, quantum)
+                print(f"    {color.GREEN}✓{color.RESET} Completed")
+        
+        for algo_id, (table, metrics, _) in fresh.items():
+            if self.cache is not None:
+                self.cache.put(keys[algo_id], CachedRun.from_table(table, None, metrics))
+        runs.update(fresh)
+        
+        for algo_id, algo_name, _ in selected_algorithms:
+            result_processes, metrics, wall_time = runs[algo_id]
             
             # Ensure all required metrics exist and are valid
             self._validate_and_fix_metrics(metrics, result_processes)
@@ -118,16 +224,54 @@ class AlgorithmComparison:
             results[algo_id] = {
                 'name': algo_name,
                 'processes': result_processes,
-                'schedule': schedule,
-                'metrics': metrics
+                'schedule': None,
+                'metrics': metrics,
+                'wall_time': wall_time
             }
-            
-            print(f"    {color.GREEN}✓{color.RESET} Completed")
         
         return results
     
+    def _run_parallel(self, processes, selected_algorithms, quantum, workers, color):
+        """Run the algorithms in a process pool over a shared-memory copy of the workload."""
+        columns = (processes.pid, processes.arrival_time, processes.burst_time, processes.priority)
+        shm = processes.to_shared_memory()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_workload,
+                                     initargs=(shm.name, len(processes))) as pool:
+                futures = {}
+                for algo_id, algo_name, algo_fn in selected_algorithms:
+                    print(f"  {color.CYAN}•{color.RESET} Processing {color.BOLD}{algo_name}{color.RESET}...")
+                    futures[algo_id] = pool.submit(_run_in_worker, algo_name, algo_fn, quantum)
+                
+                runs = {}
+                for algo_id, algo_name, _ in selected_algorithms:
+                    result_columns, metrics, wall_time = futures[algo_id].result()
+                    # Re-attach the results to the parent's copy of the inputs
+                    table = ProcessTable(*columns)
+                    for name, values in result_columns.items():
+                        setattr(table, name, values)
+                    runs[algo_id] = (table, metrics, wall_time)
+                    print(f"    {color.GREEN}✓{color.RESET} {algo_name} completed in {wall_time:.2f}s")
+        finally:
+            shm.close()
+            shm.unlink()
+        return runs
+    
     def _validate_and_fix_metrics(self, metrics, processes):
         """Ensure all required metrics exist and are valid"""
+        if isinstance(processes, ProcessTable):
+            # Same fallbacks, computed column-wise
+            fallback = processes.metrics()
+            del fallback['cpu_utilisation']
+            total_burst = int(processes.burst_time.sum())
+            max_comp = int(processes.completion_time.max()) if len(processes) else 0
+            fallback['cpu_utilization'] = min((total_burst/max_comp)*100, 100) if max_comp > 0 else 0
+            for key, value in fallback.items():
+                if key not in metrics or metrics[key] <= 0:
+                    metrics[key] = value
+            metrics.setdefault('avg_response', fallback['avg_waiting'])
+            return
+        
         # Validate/Create Waiting Time
         if 'avg_waiting' not in metrics or metrics['avg_waiting'] <= 0:
             waiting_times = [p.completion_time - p.arrival_time - p.burst_time 
@@ -242,8 +386,9 @@ class AlgorithmComparison:
                     value = results[a_id]['metrics'].get(metric, 0)
                     row.append(f"{value:.2f}")
                 table_data.append(row)
+            table_data.append(self._wall_time_row(results))
             
-            f.write(tabulate(table_data, headers=headers, tablefmt="grid"))
+            f.write(tabulate(table_data, headers=headers, tablefmt="grid", floatfmt=".2f"))
             
             # Write analysis
             f.write("\n\nANALYSIS:\n")
@@ -291,6 +436,11 @@ class AlgorithmComparison:
                     
                     f.write(f"- {a_name}: {comparison}\n")
     
+    def _wall_time_row(self, results):
+        """Table row with each algorithm's run time (seconds), or "cached" where it was not run."""
+        times = [results[a_id].get('wall_time') for a_id in results]
+        return ["Wall Time (s)"] + ["cached" if t is None else f"{t:.2f}" for t in times]
+
     def _create_comparison_table(self, results):
         # --- 1. Slim headers ---------------------------------------------------
         headers = ["Metric"]
@@ -307,12 +457,14 @@ class AlgorithmComparison:
                 value = results[algo_id]['metrics'].get(metric, 0)
                 row.append(f"{value:.2f}")
             rows.append(row)
+        rows.append(self._wall_time_row(results))
 
         # --- 3. Nicer tabulate call -------------------------------------------
         table = tabulate(
             rows,
             headers=headers,
             tablefmt="fancy_grid",   
+            floatfmt=".2f",          # a "cached" wall time must not change the other columns
             numalign="right",
             stralign="center"
         )
@@ -0,0 +1,147 @@
+# Arrival Stream shared by every scheduler in algorithms/
+#
+# Schedulers used to admit arrivals with `arrival.pop(0)` on a sorted list,
+# which is O(n) per pop and quadratic overall. ArrivalStream sorts once and
+# walks a cursor forward instead, so admitting the whole workload is linear.
+
+from collections import deque
+from typing import Iterable, Iterator, List
+from process import Process
+
+
+class ArrivalStream:
+    """Processes sorted by arrival time plus a cursor over the ones not yet admitted."""
+
+    def __init__(self, processes: Iterable[Process]):
+        # Stable sort: processes arriving together keep their input order
+        self._procs: List[Process] = sorted(processes, key=lambda p: p.arrival_time)
+        self._pos = 0
+
+    def __bool__(self) -> bool:
+        """True while some process has not been admitted yet."""
+        return self._pos < len(self._procs)
+
+    def __len__(self) -> int:
+        """Number of processes still waiting to arrive."""
+        return len(self._procs) - self._pos
+
+    def __iter__(self) -> Iterator[Process]:
+        """Admit the remaining processes one by one, in arrival order."""
+        while self._pos < len(self._procs):
+            p = self._procs[self._pos]
+            self._pos += 1
+            yield p
+
+    @property
+    def admitted(self) -> int:
+        """How many processes have been admitted so far."""
+        return self._pos
+
+    def peek(self):
+        """Next process to arrive, or None when the stream is exhausted."""
+        if self._pos < len(self._procs):
+            return self._procs[self._pos]
+        return None
+
+    def next_arrival_time(self):
+        """Arrival time of the next process, or infinity when none is left."""
+        if self._pos < len(self._procs):
+            return self._procs[self._pos].arrival_time
+        return float('inf')
+
+    def admit_until(self, time) -> List[Process]:
+        """Admit and return every pending process with arrival_time <= time."""
+        procs = self._procs
+        start = end = self._pos
+        while end < len(procs) and procs[end].arrival_time <= time:
+            end += 1
+        self._pos = end
+        return procs[start:end]
+
+
+class PresortedArrivalStream(ArrivalStream):
+    """
+    ArrivalStream over an iterator already in arrival order, pulled lazily.
+
+    Only the next process is held ahead of the clock, so a generated workload
+    can be fed to a scheduler without building the whole list first. The
+    number of processes still to come is unknown, hence no __len__.
+    """
+
+    def __init__(self, processes: Iterable[Process]):
+        self._iter = iter(processes)
+        self._next = next(self._iter, None)
+        self._pos = 0
+
+    def __bool__(self) -> bool:
+        return self._next is not None
+
+    def __len__(self) -> int:
+        raise TypeError("a presorted arrival stream has no known length")
+
+    def __iter__(self) -> Iterator[Process]:
+        while self._next is not None:
+            yield self._advance()
+
+    def _advance(self) -> Process:
+        """Admit the next process and look one ahead, checking the order."""
+        p = self._next
+        self._next = next(self._iter, None)
+        if self._next is not None and self._next.arrival_time < p.arrival_time:
+            raise ValueError(f"Process {self._next.pid} arrives before process {p.pid}: "
+                             "streamed workloads must be in arrival order")
+        self._pos += 1
+        return p
+
+    def peek(self):
+        return self._next
+
+    def next_arrival_time(self):
+        if self._next is not None:
+            return self._next.arrival_time
+        return float('inf')
+
+    def admit_until(self, time) -> List[Process]:
+        admitted = []
+        while self._next is not None and self._next.arrival_time <= time:
+            admitted.append(self._advance())
+        return admitted
+
+
+class LiveArrivals:
+    """
+    Arrivals submitted one at a time while a simulation runs (see algorithms.online).
+
+    Only processes that have not been admitted yet are held. The submitter
+    keeps them in arrival order.
+    """
+
+    def __init__(self):
+        self._pending = deque()
+        self.admitted = 0
+
+    def push(self, p: Process):
+        """Queue a newly submitted process (no earlier than the last one pushed)."""
+        self._pending.append(p)
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def peek(self):
+        return self._pending[0] if self._pending else None
+
+    def next_arrival_time(self):
+        if self._pending:
+            return self._pending[0].arrival_time
+        return float('inf')
+
+    def admit_until(self, time) -> List[Process]:
+        pending = self._pending
+        admitted = []
+        while pending and pending[0].arrival_time <= time:
+            admitted.append(pending.popleft())
+        self.admitted += len(admitted)
+        return admitted
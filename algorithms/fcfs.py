@@ -1,75 +1,208 @@
 # First-Come, First-Served (FCFS) Scheduling Algorithm
 
+import time
+from collections import deque
+from collections.abc import Iterator
 from typing import List, Tuple, Dict
-from process import Process
 
-def fcfs_schedule(process_list: List[Process]) -> Tuple[List[Process], List[dict], Dict[str, float]]:
+import numpy as np
+
+from process import Process, accepts_process_specs
+from process_table import ProcessTable
+from schedule import Schedule
+from algorithms.kernel import Policy, simulate
+from algorithms.instrumentation import Instrumentation
+from algorithms.online import OnlineScheduler
+
+
+class FCFSPolicy(Policy):
     """
-    First-Come-First-Served scheduler.
-    
+    Arrival order, each process runs to completion. fcfs_schedule itself uses
+    the vectorized fcfs_arrays; this policy is for kernel-based callers.
+    """
+
+    def __init__(self):
+        self.ready_q: deque[Process] = deque()
+
+    def __len__(self) -> int:
+        return len(self.ready_q)
+
+    def enqueue(self, proc: Process):
+        self.ready_q.append(proc)
+
+    def pick(self) -> Process:
+        return self.ready_q.popleft()
+
+
+def fcfs_arrays(arrival_time, burst_time, instrument: Instrumentation = None) -> Dict[str, np.ndarray]:
+    """
+    Vectorized FCFS engine.
+
+    FCFS is a scan: start[i] = max(finish[i-1], arrival[i]). With W the running
+    sum of bursts, finish[i] = W[i] + max over j <= i of (arrival[j] - W[j-1]),
+    so the whole timeline is one cumulative sum plus one running maximum.
+
     Args:
-        process_list: List of Process objects to be scheduled
-    
+        arrival_time: Arrival times, one per process (any order)
+        burst_time: Burst times in the same order
+        instrument: Optional Instrumentation whose sort / main_loop timings are set
+
     Returns:
-        completed: List of Process objects after execution
-        schedule: Timeline of process execution (pid, start, finish)
-        stats: Performance metrics including averages and utilization
+        Dict of int64 arrays, all in execution (stable arrival) order:
+        order (row of each process in the inputs), start, finish, waiting,
+        turnaround and idle (CPU idle gap just before each process starts)
     """
-    # Sort processes by arrival time for chronological processing
-    procs = sorted(process_list, key=lambda p: p.arrival_time)
-    
-    # Track execution timeline and metrics
-    schedule = []        # Records when each process runs
-    completed = []       # Collects finished processes
-    idle_time = 0       # Tracks CPU idle periods
-    first_response = {} # Records when processes first get CPU
-    
-    # Start clock at 0
-    clock =  0
-    
-    # Process each job in arrival order
-    for proc in procs:
-        # Determine when this process can start
-        start = max(clock, proc.arrival_time)
-        
-        # Track any idle gap before this process
-        if start > clock:
-            idle_time += start - clock
-            
-        # Record first response time (same as start in FCFS)
-        first_response[proc.pid] = start - proc.arrival_time
-        
-        # Execute process and calculate metrics
-        finish = start + proc.burst_time
-        proc.turnaround_time = finish - proc.arrival_time
-        proc.waiting_time = proc.turnaround_time - proc.burst_time
-        proc.completion_time = finish
-        
-        # Record execution in schedule
-        schedule.append({
-            'pid': proc.pid,
-            'start': start,
-            'finish': finish,
-        })
-        completed.append(proc)
-        
-        # Advance clock to process completion
-        clock = finish
-    
-    # Calculate final performance metrics
-    n = len(completed)
-    avg_wait = sum(p.waiting_time for p in completed) / n if n else 0
-    avg_tat = sum(p.turnaround_time for p in completed) / n if n else 0
-    avg_resp = sum(first_response[p.pid] for p in completed) / n if n else 0
-    cpu_util = 100 * (clock - idle_time) / clock if clock else 0
-    
-    stats = {
+    if instrument is not None:
+        started = time.perf_counter()
+    arrival = np.asarray(arrival_time, dtype=np.int64)
+    burst = np.asarray(burst_time, dtype=np.int64)
+
+    # Stable sort: processes arriving together keep their input order
+    order = np.argsort(arrival, kind="stable")
+    arrival = arrival[order]
+    burst = burst[order]
+    if instrument is not None:
+        sorted_at = time.perf_counter()
+
+    work = np.cumsum(burst)          # CPU time needed by process i and everything before it
+    work_before = work - burst       # ... by everything before it
+    # The clock starts at 0, hence the clamp: the CPU never starts before time 0
+    finish = work + np.maximum.accumulate(np.maximum(arrival - work_before, 0))
+    start = finish - burst
+
+    previous_finish = np.empty_like(finish)
+    previous_finish[:1] = 0
+    previous_finish[1:] = finish[:-1]
+
+    if instrument is not None:
+        instrument.timings = {"sort": sorted_at - started, "main_loop": time.perf_counter() - sorted_at}
+    return {
+        "order": order,
+        "start": start,
+        "finish": finish,
+        "waiting": start - arrival,
+        "turnaround": finish - arrival,
+        "idle": start - previous_finish,
+    }
+
+
+def _fcfs_stats(timeline) -> Dict[str, float]:
+    """Averages and utilisation from fcfs_arrays output (sums taken as Python ints)."""
+    n = len(timeline["order"])
+    clock = int(timeline["finish"][-1]) if n else 0
+    idle_time = int(timeline["idle"].sum())
+    avg_wait = int(timeline["waiting"].sum()) / n if n else 0
+    avg_tat = int(timeline["turnaround"].sum()) / n if n else 0
+    return {
         "avg_waiting": avg_wait,
         "avg_turnaround": avg_tat,
-        "avg_response": avg_resp,
-        "cpu_utilisation": cpu_util
+        "avg_response": avg_wait,    # FCFS never pre-empts: response == waiting
+        "cpu_utilisation": 100 * (clock - idle_time) / clock if clock else 0
     }
-    
+
+
+def _fcfs_report(instrument: Instrumentation, timeline, stats_started):
+    """Fill the event counts the kernel would report; every count follows from the timeline."""
+    n = len(timeline["order"])
+    arrival = timeline["start"] - timeline["waiting"]
+    # Ready-queue depth peaks just before a dispatch: arrived so far minus already started
+    depth = np.searchsorted(arrival, timeline["start"], side="right") - np.arange(n)
+    instrument.admissions = n
+    instrument.dispatches = n
+    instrument.preemptions = 0
+    instrument.slice_expirations = 0
+    instrument.idle_jumps = int(np.count_nonzero(timeline["idle"]))
+    instrument.max_ready_depth = int(depth.max()) if n else 0
+    instrument.timings["aggregation"] = time.perf_counter() - stats_started
+
+
+def _schedule_rows(pids, timeline) -> Schedule:
+    """One schedule segment per process from fcfs_arrays output."""
+    return Schedule.from_arrays(pids, timeline["start"], timeline["finish"])
+
+
+@accepts_process_specs
+def _fcfs_objects(process_list: List[Process], metrics_only: bool = False, instrument=None):
+    """fcfs_schedule for a list of Process / ProcessSpec objects."""
+    n = len(process_list)
+    timeline = fcfs_arrays(
+        np.fromiter((p.arrival_time for p in process_list), dtype=np.int64, count=n),
+        np.fromiter((p.burst_time for p in process_list), dtype=np.int64, count=n),
+        instrument,
+    )
+
+    # Write the per-process results back in execution order
+    completed = [process_list[i] for i in timeline["order"].tolist()]
+    for proc, finish, waiting, turnaround in zip(completed,
+                                                 timeline["finish"].tolist(),
+                                                 timeline["waiting"].tolist(),
+                                                 timeline["turnaround"].tolist()):
+        proc.remaining_time = 0
+        proc.completion_time = finish
+        proc.waiting_time = waiting
+        proc.turnaround_time = turnaround
+
+    schedule = None if metrics_only else _schedule_rows([p.pid for p in completed], timeline)
+    stats_started = time.perf_counter() if instrument is not None else None
+    stats = _fcfs_stats(timeline)
+    if instrument is not None:
+        _fcfs_report(instrument, timeline, stats_started)
     return completed, schedule, stats
 
 
+def fcfs_schedule(process_list: List[Process], metrics_only: bool = False,
+                  instrument: Instrumentation = None,
+                  progress=None) -> Tuple[List[Process], Schedule, Dict[str, float]]:
+    """
+    First-Come-First-Served scheduler.
+
+    Args:
+        process_list: List of Process objects to be scheduled. ProcessSpec entries
+            get fresh ProcessResult records; a ProcessTable is filled in and
+            returned as `completed`
+        metrics_only: Return None instead of the schedule (saves its memory)
+        instrument: Optional Instrumentation to fill in (see algorithms.instrumentation)
+        progress: Optional callback(finished, total); the vectorized paths
+            finish in one step and report once
+
+    Returns:
+        completed: List of Process objects after execution
+        schedule: Schedule of process execution (pid, start, finish)
+        stats: Performance metrics including averages and utilization
+
+    The timeline itself comes from fcfs_arrays; a ProcessTable goes through it
+    without building any per-process objects. An iterator (already in arrival
+    order) is streamed through the event kernel instead.
+    """
+    if isinstance(process_list, Iterator):
+        return simulate(process_list, FCFSPolicy(), metrics_only=metrics_only, instrument=instrument,
+                        progress=progress)
+    if not isinstance(process_list, ProcessTable):
+        result = _fcfs_objects(process_list, metrics_only, instrument)
+        if progress is not None:
+            progress(len(process_list), len(process_list))
+        return result
+
+    table = process_list
+    timeline = fcfs_arrays(table.arrival_time, table.burst_time, instrument)
+    order = timeline["order"]
+    table.remaining_time[:] = 0
+    table.completion_time[order] = timeline["finish"]
+    table.waiting_time[order] = timeline["waiting"]
+    table.turnaround_time[order] = timeline["turnaround"]
+
+    schedule = None if metrics_only else _schedule_rows(table.pid[order], timeline)
+    stats_started = time.perf_counter() if instrument is not None else None
+    stats = _fcfs_stats(timeline)
+    if instrument is not None:
+        _fcfs_report(instrument, timeline, stats_started)
+    if progress is not None:
+        progress(len(table), len(table))
+    return table, schedule, stats
+
+
+class OnlineFCFS(OnlineScheduler):
+    """FCFS fed live arrivals (see algorithms.online)."""
+
+    def __init__(self):
+        super().__init__(FCFSPolicy())
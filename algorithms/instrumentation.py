@@ -0,0 +1,44 @@
+# Scheduler Instrumentation
+#
+# Opt-in report of what a scheduler run spent its time on. Pass an
+# Instrumentation to any scheduler (instrument=...) and it comes back filled
+# in next to the usual stats. Without one, the schedulers skip the extra
+# bookkeeping: no timers are read and the ready queue is never measured.
+
+from typing import Dict
+
+
+class Instrumentation:
+    """
+    Event counters and phase timings for one scheduler run.
+
+    Counters:
+        admissions: processes admitted to the ready queue on arrival
+        dispatches: times a process got the CPU (one per schedule segment)
+        preemptions: runs cut short by a higher-priority arrival
+        slice_expirations: runs that ended because the quantum ran out
+        idle_jumps: times the clock jumped over an idle gap to the next arrival
+        max_ready_depth: most processes waiting in the ready queue at once
+    Timings (seconds): sort (ordering arrivals), main_loop, aggregation (stats)
+    """
+
+    __slots__ = ("admissions", "dispatches", "preemptions", "slice_expirations",
+                 "idle_jumps", "max_ready_depth", "timings")
+
+    def __init__(self):
+        self.admissions = 0
+        self.dispatches = 0
+        self.preemptions = 0
+        self.slice_expirations = 0
+        self.idle_jumps = 0
+        self.max_ready_depth = 0
+        self.timings: Dict[str, float] = {}
+
+    def as_dict(self) -> dict:
+        """The report as plain data (JSON-serialisable)."""
+        report = {name: getattr(self, name) for name in self.__slots__ if name != "timings"}
+        report["timings"] = dict(self.timings)
+        return report
+
+    def __repr__(self):
+        return f"Instrumentation({self.as_dict()})"
@@ -0,0 +1,423 @@
+# Discrete-Event Scheduling Kernel
+#
+# Every scheduler in algorithms/ is a single-CPU, work-conserving simulation:
+# admit arrivals, pick a ready process, run it until it finishes, its slice
+# expires or (for pre-emptive policies) a new arrival takes the CPU, and jump
+# the clock over idle gaps. Simulation implements that loop once, with the
+# hot-path optimizations (arrival cursor, round fast-forwarding) in one place;
+# simulate() runs it to the end. A scheduler only supplies a Policy describing
+# its ready queue.
+
+import time
+from collections.abc import Iterator
+from typing import Callable, Dict, List, Optional, Tuple
+
+from process import Process, accepts_process_specs
+from process_table import accepts_process_table
+from schedule import Schedule
+from algorithms.arrivals import ArrivalStream, PresortedArrivalStream
+from algorithms.instrumentation import Instrumentation
+
+
+class Policy:
+    """
+    Dispatch policy plugged into simulate().
+
+    Subclasses implement the ready queue: enqueue(), pick() and __len__().
+    Optional knobs:
+        quantum: time slice length, or None to run each dispatch to completion
+        preemptive: if True, should_preempt() is asked on every arrival
+        rotation(): for sliced policies, the deque pick() cycles through while
+            nothing arrives or finishes (enables round fast-forwarding)
+    """
+
+    quantum: Optional[int] = None
+    preemptive: bool = False
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def enqueue(self, proc: Process):
+        """Add a newly arrived process to the ready queue."""
+        raise NotImplementedError
+
+    def pick(self) -> Process:
+        """Remove and return the next process to run. Only called when non-empty."""
+        raise NotImplementedError
+
+    def requeue(self, proc: Process):
+        """Return a process whose slice expired. Defaults to enqueue()."""
+        self.enqueue(proc)
+
+    def should_preempt(self, running: Process, arrived: Process) -> bool:
+        """Whether `arrived` takes the CPU from `running` (pre-emptive policies only)."""
+        return False
+
+    def preempted(self, proc: Process):
+        """Return a pre-empted process to the ready queue. Defaults to enqueue()."""
+        self.enqueue(proc)
+
+    def rotation(self):
+        """Deque served round-robin by pick(), or None if the policy does not rotate."""
+        return None
+
+
+# Roughly how many times simulate() reports progress
+PROGRESS_STEPS = 100
+
+
+def full_slices_before(span, quantum):
+    """Largest k >= 0 such that k full quanta end strictly before `span` has elapsed."""
+    k = span // quantum
+    if k * quantum >= span:
+        k -= 1
+    return max(int(k), 0)
+
+
+def expand_rounds(schedule: List[dict], quantum: int) -> List[dict]:
+    """
+    Turn a schedule produced with compress_rounds=True back into per-slice records.
+
+    Compressed records look like {'rounds': k, 'pids': [...], 'start': s, 'finish': f}:
+    k rounds in which every pid in the list ran one full quantum, in list order.
+    """
+    expanded = []
+    for row in schedule:
+        if 'rounds' not in row:
+            expanded.append(row)
+            continue
+        clock = row['start']
+        for _ in range(row['rounds']):
+            for pid in row['pids']:
+                expanded.append({'pid': pid, 'start': clock, 'finish': clock + quantum})
+                clock += quantum
+    return expanded
+
+
+def _dict_appender(records: List[dict]):
+    """Schedule.append() lookalike for the list-of-dicts format used with compress_rounds."""
+    def append(pid, start, finish, preempted=False):
+        row = {'pid': pid, 'start': start, 'finish': finish}
+        if preempted:
+            row['turnaround'] = None  # None indicates preemption
+        records.append(row)
+    return append
+
+
+class Simulation:
+    """
+    The state of one run of the event loop, so a run can be advanced in steps.
+
+    simulate() builds one and advances it to the end. algorithms.online feeds
+    one live arrivals and advances it as the clock moves on.
+    """
+
+    def __init__(self, arrivals, policy: Policy, compress_rounds: bool = False,
+                 metrics_only: bool = False, schedule=None, measure_depth: bool = False):
+        """
+        Args:
+            arrivals: ArrivalStream (or any source with the same interface)
+            policy: Fresh Policy instance holding the (empty) ready queue
+            compress_rounds / metrics_only: As for simulate()
+            schedule: Container for the segments (anything with append(), e.g.
+                a deque), filled with dict records; default is a Schedule, or
+                a list when compress_rounds is set
+            measure_depth: Track the maximum ready-queue length
+        """
+        self.arrivals = arrivals
+        self.policy = policy
+        self.compress_rounds = compress_rounds
+        self.record = not metrics_only
+        if schedule is not None:
+            self.schedule = schedule
+            self.emit = _dict_appender(schedule)
+        elif compress_rounds:
+            self.schedule = []
+            self.emit = _dict_appender(self.schedule)
+        else:
+            self.schedule = Schedule()
+            self.emit = self.schedule.append
+        self.measure_depth = measure_depth
+
+        self.completed: List[Process] = []   # Finished processes, in completion order
+        self.clock = 0                       # Simulated time
+        self.idle_time = 0                   # Time the CPU spent with nothing to run
+        self.current = None                  # Process holding the CPU
+        self.last_start = 0                  # When `current` got the CPU
+        self.slice_end = 0                   # When `current` gives it back at the latest
+        self.slices_to_check = 0             # Slices left before the next fast-forward attempt
+        # Running sums of the finished processes (Python ints) for stats()
+        self.finished = self.waiting_sum = self.turnaround_sum = self.response_sum = 0
+        # Event counts for Instrumentation
+        self.dispatches = self.preemptions = self.idle_jumps = self.max_depth = 0
+
+    def advance(self, until=float('inf')):
+        """
+        Run the loop up to time `until` (to the end by default).
+
+        Every arrival up to `until` must already be in the arrival stream. A
+        process still running at `until` keeps the CPU; its segment is only
+        recorded once it ends, so schedules do not depend on where a run was
+        paused. An idle clock stays at the last event (see idle_until).
+        """
+        arrivals = self.arrivals
+        policy = self.policy
+        quantum = policy.quantum
+        preemptive = policy.preemptive
+        rotates = quantum is not None and not preemptive
+        enqueue = policy.enqueue
+        pick = policy.pick
+        record = self.record
+        compress_rounds = self.compress_rounds
+        schedule = self.schedule
+        emit = self.emit
+        measure_depth = self.measure_depth
+        completed = self.completed
+
+        clock = self.clock
+        idle_time = self.idle_time
+        current = self.current
+        last_start = self.last_start
+        slice_end = self.slice_end
+        slices_to_check = self.slices_to_check
+        finished, waiting_sum = self.finished, self.waiting_sum
+        turnaround_sum, response_sum = self.turnaround_sum, self.response_sum
+        dispatches, preemptions = self.dispatches, self.preemptions
+        idle_jumps, max_depth = self.idle_jumps, self.max_depth
+
+        while arrivals or current or policy:
+            # Admit arrivals; a pre-emptive policy may hand them the CPU right away
+            if arrivals.next_arrival_time() <= clock:
+                for p in arrivals.admit_until(clock):
+                    enqueue(p)
+                    if current is not None and preemptive and policy.should_preempt(current, p):
+                        if record:
+                            emit(current.pid, last_start, clock, True)
+                        policy.preempted(current)
+                        current = None
+                        preemptions += 1
+                if measure_depth and len(policy) > max_depth:
+                    max_depth = len(policy)
+
+            if current is None:
+                # Nothing ready: jump to the next arrival
+                if not policy:
+                    next_arrival = arrivals.next_arrival_time()
+                    if next_arrival > until:
+                        break
+                    idle_time += next_arrival - clock
+                    clock = next_arrival
+                    idle_jumps += 1
+                    continue
+
+                # Once per round, jump over every slice that fits before the next
+                # arrival and before any process in the rotation could finish
+                if rotates:
+                    slices_to_check -= 1
+                    ring = policy.rotation() if slices_to_check <= 0 else None
+                    if ring is not None:
+                        m = len(ring)
+                        # Position i finishes during slice i + (runs left - 1) * m
+                        # (a zero burst still takes its dispatch, so at least one run)
+                        skip = min(i + (max(-(-p.remaining_time // quantum), 1) - 1) * m
+                                   for i, p in enumerate(ring))
+                        if arrivals and skip:
+                            skip = min(skip, full_slices_before(arrivals.next_arrival_time() - clock, quantum))
+                        if skip and until != float('inf'):
+                            skip = min(skip, full_slices_before(until - clock, quantum))
+                        if skip:
+                            rounds, partial = divmod(skip, m)
+                            pids = [p.pid for p in ring] if record else None
+                            for i, p in enumerate(ring):
+                                runs = rounds + (1 if i < partial else 0)
+                                if runs and p.remaining_time == p.burst_time:
+                                    p.response_time = clock + i * quantum - p.arrival_time
+                                p.remaining_time -= runs * quantum
+                            if record and compress_rounds:
+                                if rounds:
+                                    schedule.append({
+                                        'rounds': rounds,
+                                        'pids': pids,
+                                        'start': clock,
+                                        'finish': clock + rounds * m * quantum
+                                    })
+                                if partial:
+                                    schedule.append({
+                                        'rounds': 1,
+                                        'pids': pids[:partial],
+                                        'start': clock + rounds * m * quantum,
+                                        'finish': clock + skip * quantum
+                                    })
+                            elif record:
+                                for k in range(skip):
+                                    emit(pids[k % m], clock + k * quantum, clock + (k + 1) * quantum)
+                            ring.rotate(-partial)
+                            clock += skip * quantum
+                            dispatches += skip
+                        # Retry right after a jump that paid for the O(m) scan,
+                        # otherwise wait a full round so short bursts stay linear
+                        slices_to_check = 1 if skip * 8 >= m else m
+
+                # Dispatch
+                current = pick()
+                last_start = clock
+                dispatches += 1
+                if current.remaining_time == current.burst_time:
+                    current.response_time = clock - current.arrival_time
+                if quantum is not None and quantum < current.remaining_time:
+                    slice_end = clock + quantum
+                else:
+                    slice_end = clock + current.remaining_time
+
+            # Run until the slice ends or, if pre-emptive, the next arrival
+            stop = slice_end
+            if preemptive:
+                next_arrival = arrivals.next_arrival_time()
+                if next_arrival < stop:
+                    stop = next_arrival
+            if until < stop:
+                stop = until
+            current.remaining_time -= stop - clock
+            clock = stop
+
+            if current.remaining_time == 0:
+                # Finished
+                if record:
+                    emit(current.pid, last_start, clock)
+                turnaround = clock - current.arrival_time
+                current.completion_time = clock
+                current.turnaround_time = turnaround
+                current.waiting_time = turnaround - current.burst_time
+                completed.append(current)
+                finished += 1
+                waiting_sum += turnaround - current.burst_time
+                turnaround_sum += turnaround
+                response_sum += current.response_time
+                current = None
+            elif clock == slice_end:
+                # Slice expired: arrivals up to now queue ahead of the re-queued process
+                if record:
+                    emit(current.pid, last_start, clock)
+                for p in arrivals.admit_until(clock):
+                    enqueue(p)
+                policy.requeue(current)
+                current = None
+                if measure_depth and len(policy) > max_depth:
+                    max_depth = len(policy)
+            elif clock == until:
+                # Paused mid-run; the next advance() picks up from here
+                break
+            # Otherwise an arrival interrupted the run: the next pass admits it
+
+        self.clock = clock
+        self.idle_time = idle_time
+        self.current = current
+        self.last_start = last_start
+        self.slice_end = slice_end
+        self.slices_to_check = slices_to_check
+        self.finished, self.waiting_sum = finished, waiting_sum
+        self.turnaround_sum, self.response_sum = turnaround_sum, response_sum
+        self.dispatches, self.preemptions = dispatches, preemptions
+        self.idle_jumps, self.max_depth = idle_jumps, max_depth
+
+    def idle_until(self, t):
+        """Let the clock of an idle CPU run on to t (nothing may be ready before then)."""
+        if self.current is None and not self.policy and self.clock < t:
+            self.idle_time += t - self.clock
+            self.clock = t
+
+    def stats(self) -> Dict[str, float]:
+        """avg_waiting, avg_turnaround, avg_response and cpu_utilisation so far."""
+        # Sums stay Python ints until the final division
+        n = self.finished
+        clock = self.clock
+        return {
+            'avg_waiting': self.waiting_sum / n if n else 0,
+            'avg_turnaround': self.turnaround_sum / n if n else 0,
+            'avg_response': self.response_sum / n if n else 0,
+            'cpu_utilisation': 100 * (clock - self.idle_time) / clock if clock else 0
+        }
+
+
+@accepts_process_table
+@accepts_process_specs
+def simulate(
+    processes: List[Process],
+    policy: Policy,
+    compress_rounds: bool = False,
+    metrics_only: bool = False,
+    instrument: Optional[Instrumentation] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[List[Process], Optional[Schedule], Dict[str, float]]:
+    """
+    Run `processes` through the single-CPU event loop under `policy`.
+
+    Args:
+        processes: List of Process objects (ProcessSpec entries and ProcessTable
+            inputs are accepted, see accepts_process_specs / accepts_process_table).
+            An iterator is consumed lazily and must yield in arrival order
+            (e.g. a workload_generator.WorkloadGenerator)
+        policy: Fresh Policy instance holding the (empty) ready queue
+        compress_rounds: Record fast-forwarded stretches of a rotating policy as
+            one {'rounds', 'pids', 'start', 'finish'} entry (see expand_rounds)
+        metrics_only: Skip the segment list entirely; only per-process results
+            and stats are produced, so memory stays O(ready set) beyond them
+        instrument: Optional Instrumentation to fill in with event counts, the
+            maximum ready-queue depth and phase timings
+        progress: Optional callback(finished, total), called about PROGRESS_STEPS
+            times as simulated time passes; an exception raised by it aborts
+            the run. total is None for an iterator
+
+    Returns:
+        completed: Processes in completion order, with completion, waiting,
+            turnaround and response times filled in
+        schedule: Schedule of execution segments (pid, start, finish); segments
+            cut short by pre-emption carry 'turnaround': None. A list of dicts
+            when compress_rounds is set, None when metrics_only
+        stats: avg_waiting, avg_turnaround, avg_response, cpu_utilisation
+    """
+    if instrument is not None:
+        started = time.perf_counter()
+    if isinstance(processes, Iterator):
+        arrivals = PresortedArrivalStream(processes)
+    else:
+        arrivals = ArrivalStream(processes)
+    if instrument is not None:
+        sorted_at = time.perf_counter()
+
+    run = Simulation(arrivals, policy, compress_rounds, metrics_only,
+                     measure_depth=instrument is not None)
+    if progress is None:
+        run.advance()
+    elif isinstance(processes, Iterator):
+        run.advance()
+        progress(run.finished, None)
+    else:
+        # Step through time up to a bound on the makespan: the last arrival
+        # plus all the work
+        total = len(processes)
+        end = max((p.arrival_time for p in processes), default=0) + sum(p.burst_time for p in processes)
+        step = max(-(-end // PROGRESS_STEPS), 1)
+        until = 0
+        while arrivals or run.current or policy:
+            until += step
+            run.advance(until)
+            progress(run.finished, total)
+
+    if instrument is not None:
+        looped_at = time.perf_counter()
+    stats = run.stats()
+
+    if instrument is not None:
+        instrument.admissions = arrivals.admitted
+        instrument.dispatches = run.dispatches
+        instrument.preemptions = run.preemptions
+        instrument.slice_expirations = run.dispatches - run.finished - run.preemptions
+        instrument.idle_jumps = run.idle_jumps
+        instrument.max_ready_depth = run.max_depth
+        instrument.timings = {
+            'sort': sorted_at - started,
+            'main_loop': looped_at - sorted_at,
+            'aggregation': time.perf_counter() - looped_at,
+        }
+    return run.completed, run.schedule if run.record else None, stats
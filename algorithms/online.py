@@ -0,0 +1,146 @@
+# Online Scheduling
+#
+# The batch schedulers take a whole process list and run it to completion.
+# OnlineScheduler drives the same event loop (algorithms.kernel.Simulation)
+# from a live feed instead: submit processes as they arrive and move the clock
+# forward with advance_to() or step(). Finished segments and processes are
+# handed out through generators and dropped once consumed, so memory follows
+# the ready set instead of the history. Each algorithm module defines a
+# subclass for its policy (OnlineFCFS, OnlineRoundRobin, ...).
+#
+#     rr = OnlineRoundRobin(quantum=4)
+#     rr.submit(Process(1, 0, 10))
+#     rr.advance_to(5)
+#     for segment in rr.segments():
+#         print(segment)          # {'pid': 1, 'start': 0, 'finish': 4}
+#
+# Running to the same point on the same processes gives the same segments
+# and results as the batch scheduler, wherever the clock was advanced (with
+# compress_rounds, the round entries may be grouped differently but expand to
+# the same slices).
+
+from collections import deque
+from typing import Iterator, Optional
+
+from process import Process, ProcessResult, ProcessSpec
+from algorithms.arrivals import LiveArrivals
+from algorithms.kernel import Policy, Simulation
+
+
+class OnlineScheduler:
+    """
+    A scheduler fed one process at a time while its clock moves forward.
+
+    advance_to(t) declares that every process arriving at or before t has
+    been submitted. From then on, submissions must arrive after t and in
+    arrival order.
+    """
+
+    def __init__(self, policy: Policy, compress_rounds: bool = False):
+        """
+        Args:
+            policy: Fresh Policy instance holding the (empty) ready queue
+            compress_rounds: Hand out fast-forwarded stretches of a rotating
+                policy as one {'rounds', 'pids', 'start', 'finish'} segment
+        """
+        self._arrivals = LiveArrivals()
+        self._segments = deque()
+        self._run = Simulation(self._arrivals, policy, compress_rounds, schedule=self._segments)
+        self._run.completed = deque()
+        self.horizon = None          # Latest time passed to advance_to()
+        self._last_arrival = None
+
+    @property
+    def clock(self):
+        """Current simulated time."""
+        return self._run.clock
+
+    def submit(self, process) -> Process:
+        """
+        Add an arriving process. A ProcessSpec gets a fresh ProcessResult,
+        which is returned; a Process is updated in place as it runs.
+        """
+        if isinstance(process, ProcessSpec):
+            process = ProcessResult(process)
+        if self.horizon is not None and process.arrival_time <= self.horizon:
+            raise ValueError(f"Process {process.pid} arrives at {process.arrival_time}, "
+                             f"but the clock was already advanced to {self.horizon}")
+        if self._last_arrival is not None and process.arrival_time < self._last_arrival:
+            raise ValueError(f"Process {process.pid} arrives before the previous submission: "
+                             "processes must be submitted in arrival order")
+        self._last_arrival = process.arrival_time
+        self._arrivals.push(process)
+        return process
+
+    def advance_to(self, t):
+        """Simulate up to time t; every process arriving by t must have been submitted."""
+        if self.horizon is not None and t < self.horizon:
+            raise ValueError(f"Cannot move the clock back from {self.horizon} to {t}")
+        self._run.advance(t)
+        self._run.idle_until(t)
+        self.horizon = t
+
+    def next_event_time(self) -> Optional[int]:
+        """
+        When the next thing happens among the submitted processes: a dispatch,
+        the end of the running slice, or an arrival. None when nothing is left.
+        """
+        run = self._run
+        if run.current is not None:
+            end = run.slice_end
+            if run.policy.preemptive:
+                end = min(end, self._arrivals.next_arrival_time())
+            return end
+        if run.policy:
+            return run.clock
+        if self._arrivals:
+            return self._arrivals.next_arrival_time()
+        return None
+
+    def step(self) -> Optional[int]:
+        """
+        Advance to next_event_time() and return it (None when idle with nothing
+        submitted). Like advance_to(), this declares every arrival up to that
+        time submitted.
+        """
+        t = self.next_event_time()
+        if t is not None:
+            self.advance_to(t)
+        return t
+
+    def flush(self):
+        """Run every submitted process to completion (nothing else may arrive before that)."""
+        self._run.advance()
+        self.horizon = self._run.clock
+
+    def segments(self) -> Iterator[dict]:
+        """
+        Yield (and forget) the segments recorded so far: {'pid', 'start',
+        'finish'}, plus 'turnaround': None when cut short by pre-emption.
+        A process still running has no segment until its run ends.
+        """
+        segments = self._segments
+        while segments:
+            yield segments.popleft()
+
+    def finished(self) -> Iterator[Process]:
+        """Yield (and forget) the processes completed so far, in completion order."""
+        completed = self._run.completed
+        while completed:
+            yield completed.popleft()
+
+    def snapshot(self) -> dict:
+        """
+        Current state: clock, running pid (or None), ready and pending
+        (submitted, not yet arrived) counts, completed count and the stats
+        over the completed processes.
+        """
+        run = self._run
+        return {
+            "clock": run.clock,
+            "running": run.current.pid if run.current is not None else None,
+            "ready": len(run.policy),
+            "pending": len(self._arrivals),
+            "completed": run.finished,
+            "stats": run.stats(),
+        }
@@ -1,111 +1,63 @@
 # Priority Round-Robin CPU Scheduling  (minimal patch – no mid-slice pre-emption)
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union
 from process import Process
+from schedule import Schedule
+from algorithms.kernel import simulate
+from algorithms.online import OnlineScheduler
+from algorithms.priority_non_preemptive import PriorityPolicy
+
+
+class PriorityRoundRobinPolicy(PriorityPolicy):
+    """
+    PriorityPolicy with a time slice: processes of the best level take turns,
+    and arrivals wait for the running slice to end (no mid-slice pre-emption).
+    """
+
+    def __init__(self, quantum: int = 4):
+        super().__init__()
+        self.quantum = quantum
+
+    def rotation(self):
+        return self.ready.top_level()
 
 
 def priority_round_robin(
     process_list: List[Process],
     quantum: int = 4,
-) -> Tuple[List[Process], List[dict], Dict[str, float]]:
+    compress_rounds: bool = False,
+    metrics_only: bool = False,
+    instrument=None,
+    progress=None,
+) -> Tuple[List[Process], Union[Schedule, List[dict], None], Dict[str, float]]:
     """
     Priority-based Round Robin scheduler.
     
     Args:
-        processes: List of Process objects to be scheduled
+        process_list: List of Process objects to be scheduled. ProcessSpec entries
+            get fresh ProcessResult records; a ProcessTable is filled in and
+            returned as `completed`
         quantum: Maximum time slice given to each process
+        compress_rounds: Record fast-forwarded stretches as compact round
+            entries (see algorithms.kernel.expand_rounds)
+        metrics_only: Return None instead of the schedule (saves its memory)
+        instrument: Optional Instrumentation to fill in (see algorithms.instrumentation)
+        progress: Optional callback(finished, total) (see algorithms.kernel.simulate)
         
     Returns
     -------
     completed : List[Process]
-    schedule  : List[dict]  (pid, start, finish, turnaround per segment)
+    schedule  : Schedule    (pid, start, finish, turnaround per segment; a list of
+                             dicts with compress_rounds, None with metrics_only)
     stats     : dict        (avg_waiting, avg_turnaround, avg_response, cpu_utilisation)
 
     """
+    return simulate(process_list, PriorityRoundRobinPolicy(quantum), compress_rounds, metrics_only,
+                    instrument, progress)
 
-    #  Setup
-    arrival = sorted(process_list, key=lambda p: p.arrival_time)
-    ready: Dict[int, List[Process]] = {}
-
-    schedule   = []
-    completed  = []
-    idle_time  = 0
-    first_resp = {}
-
-    current_time =  0
-    current      = None
-    last_start   = None #when the current process started its latest slice.
-    slice_end    = None # when the current slice should end (after quantum or earlier)
-
-    #  Main loop
-    while arrival or ready or current:
-
-        # Admit any processes that have arrived.
-        while arrival and arrival[0].arrival_time <= current_time:
-            p = arrival.pop(0)
-            ready.setdefault(p.priority, []).append(p)
-
-        # If CPU is idle, pick next ready process.
-        if not current and ready:
-            prio   = min(ready)                # lower value > higher priority
-            current = ready[prio].pop(0)
-            if not ready[prio]:
-                del ready[prio]
-
-            last_start = current_time
-            if current.pid not in first_resp:
-                first_resp[current.pid] = current_time - current.arrival_time
-            slice_end = current_time + min(quantum, current.remaining_time)
-
-        # Nothing ready? Fast-forward to next arrival.
-        if not current:
-            if arrival:
-                idle_time += arrival[0].arrival_time - current_time
-                current_time = arrival[0].arrival_time
-            continue
-
-        # Run until either slice finishes or a new job arrives.
-        next_arrival = arrival[0].arrival_time if arrival else float('inf')
-        next_tick    = min(slice_end, next_arrival)
-        run_time     = next_tick - current_time
-
-        current.remaining_time -= run_time
-        current_time            = next_tick
-
-        # Admit arrivals that happened exactly *now* (edge of slice).
-        while arrival and arrival[0].arrival_time == current_time:
-            p = arrival.pop(0)
-            ready.setdefault(p.priority, []).append(p)
-
-        # Slice finished?
-        if current_time == slice_end:
-            schedule.append({'pid': current.pid, 'start': last_start, 'finish': current_time})
-
-            if current.remaining_time == 0:              # job done
-                turnaround = current_time - current.arrival_time
-                current.completion_time  = current_time
-                current.turnaround_time  = turnaround
-                current.waiting_time     = turnaround - current.burst_time
-                completed.append(current)
-            else:                                        # needs another slice
-                ready.setdefault(current.priority, []).append(current)
-
-            current   = None
-            slice_end = None
-            last_start = None
-
-    #  Aggregate metrics
-    n = len(completed) or 1
-    avg_wait = sum(p.waiting_time     for p in completed) / n
-    avg_tat  = sum(p.turnaround_time  for p in completed) / n
-    avg_resp = sum(first_resp[p.pid]  for p in completed) / n
-    cpu_util = 100 * (current_time - idle_time) / current_time if current_time else 0
 
-    stats = {
-        'avg_waiting'    : avg_wait,
-        'avg_turnaround' : avg_tat,
-        'avg_response'   : avg_resp,
-        'cpu_utilisation': cpu_util
-    }
+class OnlinePriorityRoundRobin(OnlineScheduler):
+    """Priority Round-Robin fed live arrivals (see algorithms.online)."""
 
-    return completed, schedule, stats
+    def __init__(self, quantum: int = 4, compress_rounds: bool = False):
+        super().__init__(PriorityRoundRobinPolicy(quantum), compress_rounds)
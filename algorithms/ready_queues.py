@@ -0,0 +1,65 @@
+# Ready Queue for the priority-based schedulers
+#
+# The priority schedulers used to keep `ready` as a dict of per-priority lists,
+# calling min(ready) on every dispatch and list.pop(0) / list.insert(0, ...)
+# on the queues. PriorityReadyQueue keeps a heap of the active priority levels
+# and a deque per level instead, so dispatch, re-queue and pre-emption cost
+# O(log P) for P distinct levels rather than O(P + Q).
+
+import heapq
+from collections import deque
+from typing import Deque, Dict, List
+from process import Process
+
+
+class PriorityReadyQueue:
+    """Ready processes grouped by priority (lower number = higher priority), FIFO within a level."""
+
+    def __init__(self):
+        self._levels: Dict[int, Deque[Process]] = {}  # priority -> FIFO of ready processes
+        self._active: List[int] = []                  # heap of priorities with a non-empty FIFO
+        self._size = 0
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _level(self, priority) -> Deque[Process]:
+        queue = self._levels.get(priority)
+        if queue is None:
+            queue = self._levels[priority] = deque()
+            heapq.heappush(self._active, priority)
+        return queue
+
+    def push(self, proc: Process):
+        """Queue a process at the back of its priority level."""
+        self._level(proc.priority).append(proc)
+        self._size += 1
+
+    def push_front(self, proc: Process):
+        """Queue a process at the front of its level (used for pre-empted processes)."""
+        self._level(proc.priority).appendleft(proc)
+        self._size += 1
+
+    def top_priority(self):
+        """Best (lowest) priority value currently waiting. Queue must not be empty."""
+        return self._active[0]
+
+    def top_level(self) -> Deque[Process]:
+        """FIFO of the best priority level, or None when the queue is empty."""
+        if not self._active:
+            return None
+        return self._levels[self._active[0]]
+
+    def pop(self) -> Process:
+        """Remove and return the first process of the best priority level."""
+        priority = self._active[0]
+        queue = self._levels[priority]
+        proc = queue.popleft()
+        if not queue:
+            del self._levels[priority]
+            heapq.heappop(self._active)
+        self._size -= 1
+        return proc
@@ -0,0 +1,59 @@
+# Priority Scheduler Benchmark
+#
+# Times the three priority schedulers on workloads with many distinct priority
+# levels and deep per-level queues. With the heap-of-levels ready queue the run
+# time should grow with log(levels), not linearly with the number of levels.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_priority
+#     python -m benchmarks.bench_priority --size 20000 --levels 10 100 1000
+
+import argparse
+import random
+import time
+
+from process import Process
+from algorithms.priority_non_preemptive import priority_schedule
+from algorithms.priority_preemptive import priority_preemptive_schedule
+from algorithms.priority_rr import priority_round_robin
+
+SCHEDULERS = {
+    "Priority (non-preemptive)": lambda procs: priority_schedule(procs),
+    "Priority (preemptive)": lambda procs: priority_preemptive_schedule(procs),
+    "Priority + Round-Robin": lambda procs: priority_round_robin(procs, quantum=4),
+}
+
+
+def many_priority_workload(n, levels, seed=0):
+    """n processes spread over `levels` priorities, arriving faster than they can be served."""
+    rng = random.Random(seed)
+    clock = 0
+    processes = []
+    for pid in range(1, n + 1):
+        clock += rng.randint(0, 10)
+        processes.append(Process(pid, clock, rng.randint(1, 20), rng.randrange(levels)))
+    return processes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Priority scheduler benchmark")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--levels", type=int, nargs="+", default=[10, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Algorithm':<28}{'levels':>10}{'seconds':>10}{'us/proc':>10}")
+    for name, run in SCHEDULERS.items():
+        for levels in args.levels:
+            best = float('inf')
+            for _ in range(args.repeat):
+                processes = many_priority_workload(args.size, levels, args.seed)
+                start = time.perf_counter()
+                run(processes)
+                best = min(best, time.perf_counter() - start)
+            print(f"{name:<28}{levels:>10}{best:>10.4f}{best / args.size * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# SJF Scaling Benchmark
+#
+# Times algorithms.sjf on bursty workloads from 10^3 to 10^6 processes and
+# prints the growth curve. With the heap-backed ready queue each 10x step in
+# size should cost a little over 10x in time (n log n), not ~100x.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_sjf
+#     python -m benchmarks.bench_sjf --sizes 1000 10000 --repeat 5
+
+import argparse
+import random
+import time
+
+from process import Process
+from algorithms.sjf import sjf
+
+
+def bursty_workload(n, seed=0, burst_size=1000):
+    """Jobs arrive in bursts of `burst_size` sharing one arrival time."""
+    rng = random.Random(seed)
+    processes = []
+    clock = 0
+    for pid in range(1, n + 1):
+        if pid % burst_size == 1:
+            clock += rng.randint(1, 50 * burst_size)
+        processes.append(Process(pid, clock, rng.randint(1, 100)))
+    return processes
+
+
+def time_sjf(n, repeat, seed):
+    """Best-of-`repeat` wall time for one SJF run over n processes."""
+    best = float('inf')
+    for _ in range(repeat):
+        processes = bursty_workload(n, seed)
+        start = time.perf_counter()
+        sjf(processes)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SJF scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'N':>10} {'seconds':>10} {'us/proc':>10} {'growth':>8}")
+    prev = None
+    for n in args.sizes:
+        elapsed = time_sjf(n, args.repeat, args.seed)
+        growth = f"{elapsed / prev[1] / (n / prev[0]):.2f}" if prev else "-"
+        print(f"{n:>10} {elapsed:>10.4f} {elapsed / n * 1e6:>10.2f} {growth:>8}")
+        prev = (n, elapsed)
+
+
+if __name__ == "__main__":
+    main()
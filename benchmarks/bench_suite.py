@@ -0,0 +1,181 @@
+# Scheduler Benchmark Suite
+#
+# Runs every scheduler in algorithms/ over workload sizes 10^2 to 10^6 and
+# four workload shapes, recording wall time, peak memory and simulated events
+# per second. Results go to a JSON file and a summary table whose "slope"
+# column is the log-log growth between consecutive sizes: about 1.0 means
+# linear scaling, anything well above it flags super-linear behaviour.
+#
+# Run from the repository root:
+#     python -m benchmarks.bench_suite
+#     python -m benchmarks.bench_suite --sizes 100 1000 10000 --algorithms sjf round_robin
+#     python -m benchmarks.bench_suite --shapes bursty --json bench.json
+
+import argparse
+import json
+import math
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+from algorithms.fcfs import fcfs_schedule
+from algorithms.sjf import sjf
+from algorithms.round_robin import round_robin
+from algorithms.priority_non_preemptive import priority_schedule
+from algorithms.priority_preemptive import priority_preemptive_schedule
+from algorithms.priority_rr import priority_round_robin
+from workload_generator import (BurstyArrivals, ExponentialBursts, PoissonArrivals, PriorityMix,
+                                SimultaneousArrivals, WorkloadGenerator)
+
+QUANTUM = 4
+MEAN_BURST = 8
+
+ALGORITHMS = {
+    "fcfs_schedule": lambda procs: fcfs_schedule(procs),
+    "sjf": lambda procs: sjf(procs),
+    "round_robin": lambda procs: round_robin(procs, QUANTUM),
+    "priority_schedule": lambda procs: priority_schedule(procs),
+    "priority_preemptive_schedule": lambda procs: priority_preemptive_schedule(procs),
+    "priority_round_robin": lambda procs: priority_round_robin(procs, QUANTUM),
+}
+
+# Offered load is the arrival rate times the mean burst (1.0 = CPU saturated)
+SHAPES = {
+    # Everything queued at time 0: the deepest possible ready queue
+    "zero": lambda: (SimultaneousArrivals(), PriorityMix.uniform(8)),
+    # 25% load: the CPU is mostly idle and the ready queue stays short
+    "sparse": lambda: (PoissonArrivals(0.25 / MEAN_BURST), PriorityMix.uniform(8)),
+    # 90% load arriving in quiet and busy phases (MMPP)
+    "bursty": lambda: (BurstyArrivals((0.9 / MEAN_BURST / 4, 0.9 / MEAN_BURST * 7 / 4),
+                                      (0.9 / MEAN_BURST / 200,) * 2), PriorityMix.uniform(8)),
+    # 90% load spread over 1000 priority levels
+    "many_priorities": lambda: (PoissonArrivals(0.9 / MEAN_BURST), PriorityMix.uniform(1000)),
+}
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def make_workload(shape, size, seed=0):
+    """ProcessSpec list for one benchmark case (specs are shared read-only across repeats)."""
+    arrivals, priorities = SHAPES[shape]()
+    return WorkloadGenerator(arrivals, ExponentialBursts(MEAN_BURST), priorities,
+                             n=size, seed=seed).table().to_specs()
+
+
+def measure(algorithm, shape, size, repeat=3, seed=0):
+    """
+    Benchmark one (algorithm, shape, size) case.
+
+    Timing runs happen without tracemalloc (it slows Python code down a lot);
+    one extra traced run gives the peak memory. Events are arrivals plus
+    dispatches (schedule segments).
+
+    Returns a dict with the case, every timing sample, the best time,
+    peak_bytes, events and events_per_sec.
+    """
+    run = ALGORITHMS[algorithm]
+    specs = make_workload(shape, size, seed)
+
+    samples = []
+    events = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, schedule, _ = run(specs)
+        samples.append(time.perf_counter() - start)
+        events = size + len(schedule)
+        del schedule
+
+    tracemalloc.start()
+    try:
+        run(specs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    best = min(samples)
+    return {
+        "algorithm": algorithm,
+        "shape": shape,
+        "size": size,
+        "samples": samples,
+        "seconds": best,
+        "peak_bytes": peak,
+        "events": events,
+        "events_per_sec": events / best if best else float("inf"),
+    }
+
+
+def run_suite(algorithms, shapes, sizes, repeat=3, seed=0, progress=None):
+    """measure() every combination; `progress` is called with each result as it arrives."""
+    results = []
+    for algorithm in algorithms:
+        for shape in shapes:
+            for size in sorted(sizes):
+                result = measure(algorithm, shape, size, repeat, seed)
+                results.append(result)
+                if progress:
+                    progress(result)
+    return results
+
+
+def growth_slopes(results):
+    """Log-log slope of time against size between consecutive sizes of each (algorithm, shape)."""
+    slopes = {}
+    previous = {}
+    for r in results:
+        key = (r["algorithm"], r["shape"])
+        if key in previous:
+            p = previous[key]
+            if r["size"] > p["size"] and p["seconds"] > 0 and r["seconds"] > 0:
+                slopes[(key, r["size"])] = (math.log(r["seconds"] / p["seconds"])
+                                            / math.log(r["size"] / p["size"]))
+        previous[key] = r
+    return slopes
+
+
+def summary_table(results, superlinear=1.3):
+    """Text table of the results; slopes above `superlinear` are marked with '!'."""
+    slopes = growth_slopes(results)
+    lines = [f"{'Algorithm':<30}{'shape':<17}{'N':>9}{'seconds':>10}{'peak MB':>9}"
+             f"{'events/s':>12}{'slope':>8}"]
+    for r in results:
+        slope = slopes.get(((r["algorithm"], r["shape"]), r["size"]))
+        slope_text = "-" if slope is None else f"{slope:.2f}{'!' if slope > superlinear else ' '}"
+        lines.append(f"{r['algorithm']:<30}{r['shape']:<17}{r['size']:>9}{r['seconds']:>10.4f}"
+                     f"{r['peak_bytes'] / 2**20:>9.1f}{r['events_per_sec']:>12.0f}{slope_text:>8}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every scheduler across sizes and workload shapes")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="bench_results.json", help="where to write the JSON results")
+    args = parser.parse_args()
+
+    def progress(r):
+        print(f"  {r['algorithm']:<30}{r['shape']:<17}{r['size']:>9}  {r['seconds']:.4f}s", flush=True)
+
+    results = run_suite(args.algorithms, args.shapes, args.sizes, args.repeat, args.seed, progress)
+
+    with open(args.json, "w") as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quantum": QUANTUM,
+            "mean_burst": MEAN_BURST,
+            "results": results,
+        }, f, indent=2)
+
+    print()
+    print(summary_table(results))
+    print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
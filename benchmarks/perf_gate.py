@@ -0,0 +1,201 @@
+# Performance Regression Gate
+#
+# Records scheduler benchmark runs (benchmarks.bench_suite.measure) in a local
+# history file keyed by git revision, and compares a run against a baseline
+# revision. Each case is summarised by the median of N timing samples; a case
+# counts as slower only when the median grows by more than the tolerance or
+# the measured noise (median absolute deviation), whichever is larger. Peak
+# memory growth beyond its own tolerance is flagged as well. Any regression
+# makes the command exit with status 1, so it can gate CI or a pre-push hook.
+#
+# Run from the repository root:
+#     python -m benchmarks.perf_gate record                 # benchmark HEAD (or the working tree)
+#     python -m benchmarks.perf_gate compare --baseline main
+#     python -m benchmarks.perf_gate check --baseline main  # record, then compare
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks.bench_suite import ALGORITHMS, SHAPES, measure
+
+DEFAULT_HISTORY = ".bench_history.json"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_REPEAT = 5
+
+# Peak-memory differences below this are allocator noise, whatever the ratio
+MIN_MEMORY_DELTA = 64 * 1024
+
+
+def git_revision(ref="HEAD", working_tree=False):
+    """
+    Short hash of `ref`. With working_tree, '-dirty' is appended when tracked
+    files have uncommitted changes, so such runs never pass for the commit.
+    """
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", ref], capture_output=True,
+                             text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ref
+    if working_tree:
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True).stdout
+        if status.strip():
+            rev += "-dirty"
+    return rev
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_history(path, history):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp, path)
+
+
+def record(path, algorithms, shapes, sizes, repeat, seed=0):
+    """Benchmark the working tree and store the cases under its revision; returns the revision."""
+    revision = git_revision(working_tree=True)
+    history = load_history(path)
+    entry = history.setdefault(revision, {"cases": {}})
+    entry["timestamp"] = datetime.now().isoformat(timespec="seconds")
+    for algorithm in algorithms:
+        for shape in shapes:
+            for size in sizes:
+                result = measure(algorithm, shape, size, repeat, seed)
+                entry["cases"][f"{algorithm}/{shape}/{size}"] = {
+                    "samples": result["samples"],
+                    "peak_bytes": result["peak_bytes"],
+                }
+                print(f"  {algorithm:<30}{shape:<17}{size:>9}  "
+                      f"median {statistics.median(result['samples']):.4f}s", flush=True)
+    save_history(path, history)
+    return revision
+
+
+def relative_noise(samples):
+    """Median absolute deviation of the samples, relative to their median."""
+    median = statistics.median(samples)
+    if median <= 0:
+        return 0.0
+    return statistics.median(abs(s - median) for s in samples) / median
+
+
+def compare_cases(baseline, current, tolerance=0.10, noise_factor=3.0, memory_tolerance=0.10):
+    """
+    Diff two recorded runs case by case (only cases present in both).
+
+    Returns a list of dicts: case, baseline/current medians, time_change
+    (relative), threshold used, memory_change (relative) and status, one of
+    'ok', 'faster', 'SLOWER' or 'MEMORY'.
+    """
+    rows = []
+    for case in sorted(set(baseline["cases"]) & set(current["cases"])):
+        base, cur = baseline["cases"][case], current["cases"][case]
+        base_median = statistics.median(base["samples"])
+        cur_median = statistics.median(cur["samples"])
+        threshold = max(tolerance, noise_factor * max(relative_noise(base["samples"]),
+                                                      relative_noise(cur["samples"])))
+        time_change = cur_median / base_median - 1 if base_median > 0 else 0.0
+        memory_delta = cur["peak_bytes"] - base["peak_bytes"]
+        memory_change = memory_delta / base["peak_bytes"] if base["peak_bytes"] else 0.0
+
+        if time_change > threshold:
+            status = "SLOWER"
+        elif memory_change > memory_tolerance and memory_delta > MIN_MEMORY_DELTA:
+            status = "MEMORY"
+        elif time_change < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append({
+            "case": case,
+            "baseline": base_median,
+            "current": cur_median,
+            "time_change": time_change,
+            "threshold": threshold,
+            "memory_change": memory_change,
+            "status": status,
+        })
+    return rows
+
+
+def print_diff(rows, baseline_rev, current_rev):
+    print(f"\nBaseline {baseline_rev}  ->  current {current_rev}")
+    print(f"{'Algorithm':<30}{'shape':<17}{'N':>9}{'base s':>10}{'cur s':>10}"
+          f"{'time':>9}{'limit':>8}{'memory':>9}  status")
+    for r in rows:
+        algorithm, shape, size = r["case"].split("/")
+        print(f"{algorithm:<30}{shape:<17}{size:>9}{r['baseline']:>10.4f}{r['current']:>10.4f}"
+              f"{r['time_change']:>+9.1%}{r['threshold']:>8.0%}{r['memory_change']:>+9.1%}  {r['status']}")
+
+
+def compare(path, baseline_ref, **thresholds):
+    """Compare the working tree's stored run with `baseline_ref`'s; returns the exit status."""
+    history = load_history(path)
+    baseline_rev = git_revision(baseline_ref)
+    current_rev = git_revision(working_tree=True)
+    for rev, ref in ((baseline_rev, baseline_ref), (current_rev, "the working tree")):
+        if rev not in history:
+            print(f"No recorded run for {ref} ({rev}) in {path}; run 'record' on that revision first")
+            return 2
+    rows = compare_cases(history[baseline_rev], history[current_rev], **thresholds)
+    if not rows:
+        print("The two runs have no benchmark case in common")
+        return 2
+    print_diff(rows, baseline_rev, current_rev)
+    regressions = [r for r in rows if r["status"] in ("SLOWER", "MEMORY")]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) out of {len(rows)} cases")
+        return 1
+    print(f"\nNo regressions in {len(rows)} cases")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark regression gate")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="results file (JSON)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(p):
+        p.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+        p.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+        p.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+        p.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="samples per case (median of N)")
+        p.add_argument("--seed", type=int, default=0)
+
+    def add_compare_options(p):
+        p.add_argument("--baseline", required=True, help="git revision to compare against")
+        p.add_argument("--tolerance", type=float, default=0.10, help="allowed median slowdown")
+        p.add_argument("--noise-factor", type=float, default=3.0,
+                       help="multiples of the relative MAD that count as noise")
+        p.add_argument("--memory-tolerance", type=float, default=0.10, help="allowed peak memory growth")
+
+    add_run_options(commands.add_parser("record", help="benchmark the working tree and store the results"))
+    add_compare_options(commands.add_parser("compare", help="compare the working tree's stored run to a baseline"))
+    check = commands.add_parser("check", help="record, then compare")
+    add_run_options(check)
+    add_compare_options(check)
+    args = parser.parse_args()
+
+    if args.command in ("record", "check"):
+        revision = record(args.history, args.algorithms, args.shapes, args.sizes, args.repeat, args.seed)
+        print(f"Recorded {revision} in {args.history}")
+        if args.command == "record":
+            return 0
+    return compare(args.history, args.baseline, tolerance=args.tolerance,
+                   noise_factor=args.noise_factor, memory_tolerance=args.memory_tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,16 +4,38 @@
 # It handles file uploads, algorithm configuration, and result visualization.
 
 from __future__ import annotations
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify
-import importlib, json, pathlib, sys, os
-import pandas as pd
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
+import json, pathlib, sys, os, threading
+from collections import OrderedDict
+import numpy as np
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
 import main  # reuse helpers
+from job_queue import JobQueue, QueueFull, run_scheduler
+from process_table import ProcessTable
+from schedule_index import IDLE, ScheduleIndex
+from workload_loader import WorkloadError, load_records, load_workload
+from workload_store import workload_store
 
 app = Flask(__name__, template_folder="templates")
 app.secret_key = os.urandom(16)            # for session
 
+# Simulations run in background worker processes (at most 2 at once, 8 waiting)
+jobs = JobQueue(max_workers=2, max_queued=8)
+
+# Rows of a stored workload sent back to the configuration table
+UPLOAD_PREVIEW_ROWS = 500
+
+# Larger schedules are not embedded in result.html (the Gantt chart pages
+# through /jobs/<id>/gantt instead) and are not animated
+ANIMATION_MAX_SEGMENTS = 5000
+
+# Time indexes of the runs viewed last, built on their first Gantt or playback request
+MAX_SCHEDULE_INDEXES = 8
+MAX_PLAYBACK_FRAMES = 4096
+_schedule_indexes = OrderedDict()
+_schedule_indexes_lock = threading.Lock()    # shared by the request threads
+
 # algorithm map 
 from algorithms.sjf               import sjf
 from algorithms.round_robin       import round_robin
@@ -45,17 +67,36 @@ def config():
     if "username" not in session:
         return redirect(url_for("welcome"))
     if request.method == "POST":
-        session["payload"] = request.form.to_dict()
+        # The workload itself stays on the server; the session cookie keeps its id
+        payload = request.form.to_dict()
+        proc_json = payload.pop("proc_json", "")
+        if payload.get("workload_id") not in workload_store:
+            # No stored workload (none uploaded, or it expired): use the table rows
+            need_priority = algos[payload["algorithm"]][2] if payload.get("algorithm") in algos else False
+            try:
+                table = load_records(json.loads(proc_json), need_priority)
+            except (ValueError, TypeError) as e:
+                if proc_json:
+                    flash(f"Invalid process data: {e}")
+                elif payload.get("workload_id"):
+                    flash("The uploaded workload is no longer available; please upload it again")
+                else:
+                    flash("Add or upload some processes first")
+                return redirect(url_for("config"))
+            payload["workload_id"] = workload_store.put(table)
+        session["payload"] = payload
+        session["workload_id"] = payload["workload_id"]
         return redirect(url_for("run"))
     return render_template("config.html",
                            algos=algos,
-                           username=session["username"])
+                           username=session["username"],
+                           workload=_workload_preview(session.get("workload_id")))
 
 @app.route("/run")
 def run():
     """
-    Execute selected scheduling algorithm and display results.
-    Shows Gantt chart and performance metrics.
+    Submit the selected scheduling algorithm as a background job and
+    send the browser to its progress page.
     """
     payload = session.pop("payload", None)
     if not payload:
@@ -64,10 +105,11 @@ def run():
     algo_key = payload["algorithm"]
     name, algo_fn, need_prio, need_q = algos[algo_key]
 
-    # Build Process list
-    plist_json = json.loads(payload["proc_json"])
-    Process = importlib.import_module("process").Process
-    plist = [Process(**p) for p in plist_json]
+    # The job gets the workload as columns and schedules the table as it is
+    try:
+        table = workload_store.get(payload["workload_id"])
+    except KeyError:
+        return redirect(url_for("config"))
 
     extra = {}
     if need_q:
@@ -75,8 +117,122 @@ def run():
         if "prio" in algo_key:
             extra["context_switch"] = int(payload.get("ctx", 0))
 
-    completed, schedule, metrics = algo_fn(plist, **extra)
-    
+    try:
+        job_id = jobs.submit(run_scheduler, algo_fn, table, extra,
+                             instrument=bool(payload.get("instrument")), label=name)
+    except QueueFull as e:
+        return render_template("job.html", job=None, error=str(e)), 503
+    return redirect(url_for("job_wait", job_id=job_id))
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    """Job state and progress as JSON (polled by job.html)."""
+    try:
+        return jsonify(jobs.status(job_id))
+    except KeyError:
+        return jsonify({'error': 'Unknown job'}), 404
+
+@app.route("/jobs/<job_id>/cancel", methods=["POST"])
+def job_cancel(job_id):
+    """Cancel a queued or running job."""
+    try:
+        return jsonify({'cancelled': jobs.cancel(job_id)})
+    except KeyError:
+        return jsonify({'error': 'Unknown job'}), 404
+
+@app.route("/jobs/<job_id>/wait")
+def job_wait(job_id):
+    """Progress page; moves on to the results once the job is done."""
+    try:
+        status = jobs.status(job_id)
+    except KeyError:
+        return redirect(url_for("config"))
+    return render_template("job.html", job=status, error=status["error"])
+
+@app.route("/jobs/<job_id>/result")
+def job_result(job_id):
+    """Display the results of a finished job."""
+    try:
+        status = jobs.status(job_id)
+    except KeyError:
+        return redirect(url_for("config"))
+    if status["state"] != "done":
+        return redirect(url_for("job_wait", job_id=job_id))
+    completed, schedule, metrics, instrumentation = jobs.result(job_id)
+    if isinstance(completed, ProcessTable):
+        # The result page lists processes in completion order
+        completed = completed.to_processes()
+        completed.sort(key=lambda p: p.completion_time)
+    return _render_result(job_id, status["label"], completed, schedule, metrics, instrumentation)
+
+@app.route("/jobs/<job_id>/gantt")
+def job_gantt(job_id):
+    """
+    Visible part of a finished run's Gantt chart as JSON.
+    Query: start, end (time window, default the whole run) and width (pixels).
+    """
+    index, error = _schedule_index(job_id)
+    if error:
+        return error
+    start = request.args.get('start', 0, type=float)
+    end = request.args.get('end', index.makespan, type=float)
+    width = request.args.get('width', 1000, type=int)
+    if end <= start or not 1 <= width <= 10000:
+        return jsonify({'error': 'Need start < end and 1 <= width <= 10000'}), 400
+    window = index.window(start, end, width)
+    window['makespan'] = index.makespan
+    return jsonify(window)
+
+@app.route("/jobs/<job_id>/playback")
+def job_playback(job_id):
+    """
+    Animation frames of a finished run as JSON: for each integer time from
+    start to start + frames - 1, the position of the running segment (in
+    start order; -1 when idle) and its pid (null when idle).
+    """
+    index, error = _schedule_index(job_id)
+    if error:
+        return error
+    start = request.args.get('start', 0, type=int)
+    frames = request.args.get('frames', 256, type=int)
+    if not 1 <= frames <= MAX_PLAYBACK_FRAMES:
+        return jsonify({'error': f'Need 1 <= frames <= {MAX_PLAYBACK_FRAMES}'}), 400
+    times = np.arange(start, start + frames)
+    segment = index.segment_at(times)
+    pid = index.pid_at(times)
+    return jsonify({'start': start,
+                    'segment': segment.tolist(),
+                    'pid': [None if p == IDLE else p for p in pid.tolist()]})
+
+def _schedule_index(job_id):
+    """
+    (ScheduleIndex, None) for a job that is done, or (None, error response).
+    """
+    try:
+        status = jobs.status(job_id)
+    except KeyError:
+        return None, (jsonify({'error': 'Unknown job'}), 404)
+    if status["state"] != "done":
+        return None, (jsonify({'error': f'The job is {status["state"]}'}), 409)
+    with _schedule_indexes_lock:
+        index = _schedule_indexes.get(job_id)
+        if index is not None:
+            _schedule_indexes.move_to_end(job_id)
+            return index, None
+    # Built outside the lock: other runs' requests need not wait for it
+    index = ScheduleIndex(jobs.result(job_id)[1])
+    with _schedule_indexes_lock:
+        index = _schedule_indexes.setdefault(job_id, index)
+        _schedule_indexes.move_to_end(job_id)
+        while len(_schedule_indexes) > MAX_SCHEDULE_INDEXES:
+            _schedule_indexes.popitem(last=False)
+    return index, None
+
+def _render_result(run_id, algo_name, completed, schedule, metrics, instrumentation=None):
+    """
+    Render result.html for a finished run.
+    Shows Gantt chart and performance metrics.
+    """
     # Serialize processes
     serialized_procs = [{
         'job': str(p.pid),
@@ -101,6 +257,7 @@ def run():
         pid_to_color[p.pid] = process_colors[color_index]
 
     # Calculate averages
+    metrics = dict(metrics)
     total_turnaround = sum(p.turnaround_time for p in completed)
     total_waiting = sum(p.waiting_time for p in completed)
     num_procs = len(completed)
@@ -109,9 +266,11 @@ def run():
 
     return render_template("result.html",
         name=session.get("username", "User"),
-        algo=name,
-        schedule=schedule,
+        algo=algo_name,
+        run_id=run_id,
+        schedule=list(schedule) if len(schedule) <= ANIMATION_MAX_SEGMENTS else None,
         metrics=metrics,
+        instrumentation=instrumentation,
         procs=serialized_procs,
         total_time=max(p.completion_time for p in completed) if completed else 0,
         processColors=process_colors,
@@ -129,13 +288,21 @@ def upload_processes():
     
     try:
         if file.filename.endswith('.json'):
-            processes = process_json_file(file)
-        elif file.filename.endswith(('.xlsx', '.xls')):
-            processes = process_excel_file(file)
+            table = load_records(process_json_file(file))
+        elif file.filename.endswith(('.csv', '.xlsx', '.xls')):
+            table = process_table_file(file)
         else:
             return jsonify({'error': 'Unsupported file format'}), 400
         
-        return jsonify({'processes': processes})
+        preview = _workload_preview(workload_store.put(table))
+        return jsonify({'processes': preview['processes'],
+                        'count': preview['count'],
+                        'workload_id': preview['id']})
+    except WorkloadError as e:
+        # Row problems go back one by one so the page can point at them
+        return jsonify({'error': str(e),
+                        'error_count': e.error_count,
+                        'rows': [issue._asdict() for issue in e.errors]}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -145,6 +312,23 @@ def set_algorithm():
     session['current_algorithm'] = data.get('algorithm', '')
     return jsonify({'success': True})
 
+def _workload_preview(workload_id):
+    """
+    {'id', 'count', 'processes'} for a stored workload (processes holds the
+    first UPLOAD_PREVIEW_ROWS rows), or None if there is none.
+    """
+    if not workload_id:
+        return None
+    try:
+        table = workload_store.get(workload_id)
+    except KeyError:
+        return None
+    n = min(len(table), UPLOAD_PREVIEW_ROWS)
+    processes = [{'pid': pid, 'arrival_time': arrival, 'burst_time': burst, 'priority': priority}
+                 for pid, arrival, burst, priority in zip(table.pid[:n].tolist(), table.arrival_time[:n].tolist(),
+                                                          table.burst_time[:n].tolist(), table.priority[:n].tolist())]
+    return {'id': workload_id, 'count': len(table), 'processes': processes}
+
 def process_json_file(file):
     """
     Parse process data from JSON file.
@@ -203,82 +387,25 @@ def process_json_file(file):
     except json.JSONDecodeError:
         raise ValueError("Invalid JSON format")
 
-def process_excel_file(file):
+def process_table_file(file):
     """
-    Parse process data from Excel file.
+    Parse process data from a CSV or Excel file (see workload_loader).
     Args:
-        file_path: Path to Excel file containing process data
+        file: Uploaded file; its name picks the format
     Returns:
-        list: List of Process objects created from file data
+        ProcessTable: The workload, PIDs numbered from 1 in row order
+    Raises:
+        WorkloadError: Missing columns or invalid rows (each one listed)
     """
+    algorithm = session.get('current_algorithm', '')
+    needs_priority = any(word in algorithm.lower() for word in ['priority', 'prio'])
     try:
-        df = pd.read_excel(file)
-        algorithm = session.get('current_algorithm', '')
-        needs_priority = any(word in algorithm.lower() for word in ['priority', 'prio'])
-        
-        # Check for column names (case-insensitive)
-        df.columns = df.columns.str.lower()
-        column_mapping = {
-            'arrival_time': ['arrival time', 'arrival', 'at'],
-            'burst_time': ['burst time', 'burst', 'bt'],
-            'priority': ['priority', 'prio', 'pr']
-        }
-        
-        # Map columns to standardized names
-        for std_name, variations in column_mapping.items():
-            for col in df.columns:
-                if col in variations:
-                    df = df.rename(columns={col: std_name})
-                    break
-        
-        # Validate required columns
-        missing_cols = [col for col in ['burst_time'] 
-                       if col not in df.columns]
-        if needs_priority:
-            if 'priority' not in df.columns:
-                raise ValueError(f"Priority column is required for {algorithm} algorithm")
-            missing_cols.extend([col for col in ['priority'] if col not in df.columns])
-        
-        if missing_cols:
-            raise ValueError(f"Missing required columns: {', '.join(missing_cols)}")
-        
-        # Convert to list of dictionaries
-        processes = []
-        for i, row in df.iterrows():
-            # Automatically assign PID as index + 1
-            pid = i + 1
-            arrival_time = int(row.get('arrival_time', 0))
-            
-            if 'burst_time' not in row:
-                raise ValueError(f"Process {pid}: Missing required field 'burst_time'")
-            burst_time = int(row['burst_time'])
-            
-            # Priority validation
-            if needs_priority:
-                if 'priority' not in row:
-                    raise ValueError(f"Process {pid}: Priority is required for {algorithm} algorithm")
-                priority = int(row['priority'])
-            else:
-                priority = int(row.get('priority', 0))
-            
-            # Value validation
-            if burst_time <= 0:
-                raise ValueError(f"Process {pid}: Burst time must be positive")
-            if arrival_time < 0:
-                raise ValueError(f"Process {pid}: Arrival time cannot be negative")
-            if needs_priority and priority < 0:
-                raise ValueError(f"Process {pid}: Priority cannot be negative")
-            
-            processes.append({
-                'pid': pid,
-                'arrival_time': arrival_time,
-                'burst_time': burst_time,
-                'priority': priority
-            })
-        
-        return processes
+        table, _ = load_workload(file.stream, filename=file.filename, need_priority=needs_priority)
+    except WorkloadError:
+        raise
     except Exception as e:
-        raise ValueError(f"Error processing Excel file: {str(e)}")
+        raise ValueError(f"Error processing file: {str(e)}")
+    return table
 
 if __name__ == "__main__":
     app.run(debug=True)
\ No newline at end of file
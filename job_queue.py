@@ -0,0 +1,252 @@
+# Background Simulation Jobs
+#
+# A large run (hundreds of thousands of processes) can take longer than a web
+# request should. JobQueue runs such calls in a small local process pool
+# instead: submit() returns a job id right away, status() reports progress
+# while the job runs, and result() hands back the return value once it is
+# done. The pool size is the concurrency limit; beyond it, at most
+# `max_queued` jobs wait for a worker and further submissions are refused.
+#
+# Progress and cancel requests travel through a multiprocessing.Manager dict.
+# The job callable receives a progress(finished, total) callback (the
+# schedulers' progress hook); a cancelled job stops at its next report.
+# ProcessTable arguments are not pickled: they travel to the worker in a
+# shared-memory block (as in sharded.py), released once the job is finished.
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from multiprocessing import Manager, shared_memory
+from typing import NamedTuple, Optional
+
+from algorithms.instrumentation import Instrumentation
+from process_table import ProcessTable
+from result_cache import result_cache
+
+# Finished jobs kept for status()/result() before the oldest are forgotten
+KEEP_FINISHED = 32
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's progress callback once the job has been cancelled."""
+
+
+class QueueFull(RuntimeError):
+    """Raised by JobQueue.submit when `max_queued` jobs are already waiting."""
+
+
+class _SharedTable(NamedTuple):
+    """Stands in for a ProcessTable argument: the shared-memory block holding its inputs."""
+    name: str
+    n: int
+
+
+class _Job:
+    """Parent-side record of one submitted job."""
+
+    __slots__ = ("id", "label", "future", "blocks", "submitted", "ended", "state", "error")
+
+    def __init__(self, job_id, label, future, blocks):
+        self.id = job_id
+        self.label = label
+        self.future = future
+        self.blocks = blocks         # Shared-memory blocks to unlink once finished
+        self.submitted = time.time()
+        self.ended = None
+        self.state = None            # Set once finished: done / failed / cancelled
+        self.error = None
+
+
+def _attach(arg):
+    """Worker side of a _SharedTable: a fresh ProcessTable with its own copy of the inputs."""
+    if not isinstance(arg, _SharedTable):
+        return arg
+    shm = shared_memory.SharedMemory(name=arg.name)
+    table = ProcessTable.from_shared_memory(shm, arg.n)
+    # Copy the inputs so the block can be released right away
+    table = ProcessTable(table.pid.copy(), table.arrival_time.copy(),
+                         table.burst_time.copy(), table.priority.copy())
+    shm.close()
+    return table
+
+
+def _run_job(job_id, fn, args, kwargs, progress, cancel):
+    """Pool task: call fn with a progress callback wired to the shared dicts."""
+    def report(finished, total):
+        if job_id in cancel:
+            raise JobCancelled(job_id)
+        progress[job_id] = (finished, total)
+
+    if job_id in cancel:
+        raise JobCancelled(job_id)
+    progress[job_id] = (0, None)
+    return fn(*(_attach(arg) for arg in args), progress=report, **kwargs)
+
+
+def run_scheduler(algo_fn, processes, params, instrument: bool = False, progress=None):
+    """
+    Job body for one scheduler run: (completed, schedule, stats, instrumentation).
+
+    Goes through the result cache unless instrumented (a cached result has
+    nothing to measure); instrumentation is the report as a dict, or None.
+    A ProcessTable goes through the schedulers' table path as it is, so
+    `completed` is then the filled-in table (see accepts_process_table).
+    """
+    if instrument:
+        report = Instrumentation()
+        completed, schedule, stats = algo_fn(processes, **params, instrument=report, progress=progress)
+        return completed, schedule, stats, report.as_dict()
+    completed, schedule, stats = result_cache.run(algo_fn, processes, progress=progress, **params)
+    return completed, schedule, stats, None
+
+
+class JobQueue:
+    """
+    Runs submitted calls in a local process pool and tracks them by id.
+
+    Job states: queued, running, cancelling (cancel requested, not yet
+    stopped), done, failed, cancelled.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queued: int = 8):
+        """
+        Args:
+            max_workers: Jobs running at once (pool size)
+            max_queued: Jobs allowed to wait for a free worker
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        # The pool and the manager process start with the first job
+        self._pool = None
+        self._manager = None
+        self._progress = None
+        self._cancel = None
+
+    def _start(self):
+        if self._pool is None:
+            self._manager = Manager()
+            self._progress = self._manager.dict()
+            self._cancel = self._manager.dict()
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def submit(self, fn, *args, label: Optional[str] = None, **kwargs) -> str:
+        """
+        Queue fn(*args, progress=callback, **kwargs) and return the job id.
+
+        fn and its arguments must be picklable (module-level functions, plain
+        data, Process objects). Positional ProcessTable arguments reach fn as
+        fresh (unscheduled) tables through shared memory. Raises QueueFull
+        when too many jobs are waiting.
+        """
+        with self._lock:
+            self._start()
+            unfinished = sum(job.state is None for job in self._jobs.values())
+            if unfinished >= self.max_workers + self.max_queued:
+                raise QueueFull(f"{unfinished} jobs are already queued or running")
+            job_id = uuid.uuid4().hex
+            blocks = []
+            shared_args = []
+            for arg in args:
+                if isinstance(arg, ProcessTable):
+                    blocks.append(arg.to_shared_memory())
+                    arg = _SharedTable(blocks[-1].name, len(arg))
+                shared_args.append(arg)
+            future = self._pool.submit(_run_job, job_id, fn, tuple(shared_args), kwargs,
+                                       self._progress, self._cancel)
+            self._jobs[job_id] = _Job(job_id, label, future, blocks)
+        future.add_done_callback(lambda _, job_id=job_id: self._finished(job_id))
+        return job_id
+
+    def _finished(self, job_id):
+        """Done callback: settle the job's final state and drop old records."""
+        with self._lock:
+            job = self._jobs[job_id]
+            job.ended = time.time()
+            try:
+                job.future.result()
+                job.state = "cancelled" if job_id in self._cancel else "done"
+            except (CancelledError, JobCancelled):
+                job.state = "cancelled"
+            except Exception as e:
+                job.state = "failed"
+                job.error = f"{type(e).__name__}: {e}"
+            self._cancel.pop(job_id, None)
+            for shm in job.blocks:
+                shm.close()
+                shm.unlink()
+            job.blocks = []
+
+            finished = [key for key, record in self._jobs.items() if record.state is not None]
+            for key in finished[:-KEEP_FINISHED]:
+                del self._jobs[key]
+                self._progress.pop(key, None)
+
+    def _job(self, job_id) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Unknown job {job_id}")
+        return job
+
+    def status(self, job_id) -> dict:
+        """
+        Job state as plain data: id, label, state, finished / total processes
+        (total None until known), percent, submitted / ended times, error.
+        """
+        job = self._job(job_id)
+        # State first: a job that finishes while the progress dict is read
+        # still reports as unfinished, never as done with stale progress
+        state = job.state
+        finished, total = self._progress.get(job_id, (0, None))
+        if state is None:
+            if job_id in self._cancel:
+                state = "cancelling"
+            else:
+                state = "running" if job_id in self._progress else "queued"
+        if state == "done" and total:
+            finished = total
+        return {
+            "id": job.id,
+            "label": job.label,
+            "state": state,
+            "finished": finished,
+            "total": total,
+            "percent": 100 if state == "done" else (100 * finished // total if total else 0),
+            "submitted": job.submitted,
+            "ended": job.ended,
+            "error": job.error,
+        }
+
+    def result(self, job_id):
+        """
+        Return value of a finished job. Raises the job's exception if it failed,
+        CancelledError if it was cancelled and RuntimeError if it is not finished.
+        """
+        job = self._job(job_id)
+        if job.state is None:
+            raise RuntimeError(f"Job {job_id} has not finished")
+        if job.state == "cancelled":
+            raise CancelledError(job_id)
+        return job.future.result()
+
+    def cancel(self, job_id) -> bool:
+        """
+        Cancel a job: a queued job never starts, a running one stops at its
+        next progress report. Returns False if the job had already finished.
+        """
+        job = self._job(job_id)
+        if job.state is not None:
+            return False
+        if not job.future.cancel():
+            self._cancel[job_id] = True
+        return True
+
+    def shutdown(self, wait: bool = True):
+        """Stop the pool (cancelling queued jobs) and the manager process."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._manager.shutdown()
+            self._pool = self._manager = None
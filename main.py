@@ -11,6 +11,13 @@ from algorithms.sjf import sjf
 from algorithms.round_robin import round_robin
 from algorithms.priority_rr import priority_round_robin
 from algorithm_comparison import run_algorithm_comparison
+from quantum_sweep import run_quantum_sweep
+from result_cache import result_cache
+from trace_export import write_chrome_trace
+from sharded import sharded
+from process_table import ProcessTable
+from workload_loader import WorkloadError, load_workload
+from algorithms.instrumentation import Instrumentation
 import time
 import os
 import sys
@@ -18,6 +25,9 @@ import json
 import pandas as pd
 from datetime import datetime
 
+# File rows warned about one by one before the rest are summarized
+MAX_LOAD_WARNINGS = 20
+
 # Terminal UI Components
 # Color class provides ANSI escape codes for terminal text formatting
 # These codes enable colored output and text styling for better UX
@@ -97,18 +107,20 @@ def choose_mode():
     """
     Display mode selection menu and handle user input.
     Returns:
-        str: 'single' for single algorithm mode or 'comparison' for comparison mode
+        str: 'single' for single algorithm mode, 'comparison' for comparison mode
+             or 'sweep' for the Round-Robin quantum sweep
     """
     print_subheader("OPERATION MODE")
     print(f"  {Color.CYAN}1{Color.RESET}) {Color.BOLD}Single Algorithm{Color.RESET} - Run one scheduling algorithm")
     print(f"  {Color.CYAN}2{Color.RESET}) {Color.BOLD}Algorithm Comparison{Color.RESET} - Compare multiple algorithms")
+    print(f"  {Color.CYAN}3{Color.RESET}) {Color.BOLD}Quantum Sweep{Color.RESET} - Round-Robin metrics across a range of quanta")
     
     while True:
         choice = input_styled("Choose mode").strip()
         print(Color.RESET, end="")
         
-        if choice in ["1", "2"]:
-            return "single" if choice == "1" else "comparison"
+        if choice in ["1", "2", "3"]:
+            return {"1": "single", "2": "comparison", "3": "sweep"}[choice]
         
         print_error("Invalid option – try again.")
         time.sleep(1)
@@ -170,12 +182,13 @@ def choose_output_method():
     print(f"  {Color.CYAN}3{Color.RESET}) {Color.BOLD}Save to JSON{Color.RESET} - Save results to a JSON file")
     print(f"  {Color.CYAN}4{Color.RESET}) {Color.BOLD}Save to Excel{Color.RESET} - Save results to an Excel file")
     print(f"  {Color.CYAN}5{Color.RESET}) {Color.BOLD}Save to CSV{Color.RESET} - Save results to a CSV file")
+    print(f"  {Color.CYAN}6{Color.RESET}) {Color.BOLD}Chrome Trace{Color.RESET} - Timeline for chrome://tracing or Perfetto")
     
     while True:
         choice = input_styled("Choose output method").strip()
         print(Color.RESET, end="")
         
-        if choice in ["1", "2", "3", "4", "5"]:
+        if choice in ["1", "2", "3", "4", "5", "6"]:
             return choice
         
         print_error("Invalid option – try again.")
@@ -341,71 +354,36 @@ def read_processes_from_json(need_priority: bool = False):
             return read_processes_manually(need_priority)
 
 def read_processes_from_excel(need_priority: bool = False):
-    """Read process information from an Excel or CSV file."""
+    """
+    Read process information from an Excel or CSV file.
+
+    Returns a ProcessTable (see workload_loader); invalid values are fixed
+    or their rows skipped, with a warning for each.
+    """
     print_subheader("EXCEL/CSV FILE INPUT")
     
     while True:
         filename = input_styled("Enter file path").strip()
         try:
-            # Detect file type and read appropriately
-            if filename.endswith('.csv'):
-                df = pd.read_csv(filename)
-            else:
-                df = pd.read_excel(filename)
-            
-            # Check required columns
-            required_cols = ['arrival_time', 'burst_time']
-            if need_priority:
-                required_cols.append('priority')
+            processes, issues = load_workload(filename, need_priority=need_priority, repair=True)
             
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            if missing_cols:
-                print_error(f"Missing required columns: {', '.join(missing_cols)}")
-                print_warning("File must have columns: arrival_time, burst_time" + 
-                            (", priority" if need_priority else ""))
-                continue
+            for issue in issues[:MAX_LOAD_WARNINGS]:
+                print_warning(str(issue))
+            if len(issues) > MAX_LOAD_WARNINGS:
+                print_warning(f"... and {len(issues) - MAX_LOAD_WARNINGS} more rows fixed or skipped")
             
-            # Process the data
-            processes = []
-            for i, row in df.iterrows():
-                pid = i + 1  # Auto-generate PIDs starting from 1
-                
-                try:
-                    arrival = int(row['arrival_time'])
-                    burst = int(row['burst_time'])
-                    
-                    if arrival < 0:
-                        print_warning(f"Process #{pid} has negative arrival time, setting to 0")
-                        arrival = 0
-                    
-                    if burst <= 0:
-                        print_warning(f"Process #{pid} has invalid burst time, setting to 1")
-                        burst = 1
-                    
-                    # Handle priority for all cases
-                    priority = 0
-                    if 'priority' in df.columns and not pd.isna(row['priority']):
-                        try:
-                            priority = int(row['priority'])
-                            if priority < 0:
-                                print_warning(f"Process #{pid} has negative priority, setting to 0")
-                                priority = 0
-                        except ValueError:
-                            print_warning(f"Invalid priority for Process #{pid}, using 0")
-                    
-                    processes.append(Process(pid, arrival, burst, priority))
-                
-                except (ValueError, TypeError):
-                    print_warning(f"Skipping row {i+1} due to invalid numeric values")
-                    continue
-            
-            if not processes:
+            if not len(processes):
                 print_error("No valid processes found in the file")
                 continue
             
             print_success(f"Successfully loaded {len(processes)} processes from {filename}")
             return processes
             
+        except WorkloadError as e:
+            print_error(str(e))
+            print_warning("File must have columns: arrival_time, burst_time" + 
+                        (", priority" if need_priority else ""))
+            continue
         except FileNotFoundError:
             print_error(f"File not found: {filename}")
         except Exception as e:
@@ -465,13 +443,14 @@ def print_process_stats(processes):
         print(f"{bg_color}{Color.CYAN}{proc.pid:<6}{Color.RESET}{bg_color}"
               f"{proc.waiting_time:<16}{proc.turnaround_time:<14}{proc.completion_time:<14}{Color.RESET}")
 
-def print_metrics(metrics):
+def print_metrics(metrics, instrumentation=None):
     """
     Display overall algorithm performance metrics.
     Shows averages for waiting time, turnaround time, and CPU utilization.
     
     Args:
         metrics: Dictionary containing calculated performance metrics
+        instrumentation: Optional Instrumentation report of the run
     """
     print_subheader("PERFORMANCE METRICS")
     
@@ -480,6 +459,16 @@ def print_metrics(metrics):
         metric_name = key.replace('_', ' ').title()
         print(f"  {Color.YELLOW}{metric_name}:{Color.RESET} {Color.BOLD}{value:.2f}{Color.RESET}")
 
+    if instrumentation is not None:
+        print_subheader("INSTRUMENTATION")
+        report = instrumentation.as_dict()
+        timings = report.pop("timings")
+        for key, value in report.items():
+            print(f"  {Color.YELLOW}{key.replace('_', ' ').title()}:{Color.RESET} {Color.BOLD}{value}{Color.RESET}")
+        for phase, seconds in timings.items():
+            print(f"  {Color.YELLOW}{phase.replace('_', ' ').title()} Time:{Color.RESET} "
+                  f"{Color.BOLD}{seconds * 1000:.3f} ms{Color.RESET}")
+
 def generate_text_report(algo_name, processes, schedule_table, metrics):
     """Generate a text report of the scheduling results."""
     report = []
@@ -537,7 +526,7 @@ def save_to_json_file(algo_name, processes, schedule_table, metrics):
     result_data = {
         "algorithm": algo_name,
         "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        "schedule": schedule_table,
+        "schedule": list(schedule_table),
         "processes": [
             {
                 "pid": p.pid,
@@ -587,7 +576,7 @@ def save_to_excel_file(algo_name, processes, schedule_table, metrics):
             pd.DataFrame(process_data).to_excel(writer, sheet_name='Processes', index=False)
             
             # Schedule data
-            pd.DataFrame(schedule_table).to_excel(writer, sheet_name='Schedule', index=False)
+            pd.DataFrame(list(schedule_table)).to_excel(writer, sheet_name='Schedule', index=False)
             
             # Metrics
             metrics_df = pd.DataFrame([metrics])
@@ -639,7 +628,7 @@ def save_to_csv_file(algo_name, processes, schedule_table, metrics):
         metrics_file = f"{base_filename}_metrics.csv"
         
         pd.DataFrame(process_data).to_csv(processes_file, index=False)
-        pd.DataFrame(schedule_table).to_csv(schedule_file, index=False)
+        pd.DataFrame(list(schedule_table)).to_csv(schedule_file, index=False)
         
         # Metrics
         metrics_df = pd.DataFrame([metrics])
@@ -650,6 +639,16 @@ def save_to_csv_file(algo_name, processes, schedule_table, metrics):
     except Exception as e:
         print_error(f"Failed to save results: {e}")
 
+def save_to_trace_file(algo_name, processes, schedule_table, metrics):
+    """Save the timeline as a Chrome trace-event file (streamed, gzip-compressed)."""
+    filename = f"cpu_schedule_{algo_name.replace(' ', '_').lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.trace.json.gz"
+    
+    try:
+        events = write_chrome_trace(filename, schedule_table, processes)
+        print_success(f"{events} trace events saved to {filename} (open it in https://ui.perfetto.dev)")
+    except Exception as e:
+        print_error(f"Failed to save trace: {e}")
+
 def save_results(output_choice, algo_name, processes, schedule_table, metrics):
     """Save results based on the chosen output method."""
     if output_choice == "1":
@@ -663,11 +662,13 @@ def save_results(output_choice, algo_name, processes, schedule_table, metrics):
         save_to_excel_file(algo_name, processes, schedule_table, metrics)
     elif output_choice == "5":
         save_to_csv_file(algo_name, processes, schedule_table, metrics)
+    elif output_choice == "6":
+        save_to_trace_file(algo_name, processes, schedule_table, metrics)
 # DRIVER 
 def main():
     """
     Main program entry point. Handles:
-    1. Mode selection (single/comparison)
+    1. Mode selection (single/comparison/sweep)
     2. Algorithm selection (if single mode)
     3. Process data collection
     4. Algorithm execution
@@ -704,23 +705,40 @@ def main():
                 except ValueError:
                     print_error("Please enter a valid number")
         
-        # Execute Selected Algorithm
+        # Execute Selected Algorithm (repeat runs of a workload come from the cache,
+        # except with --instrument, which always runs and reports what happened).
+        # Large workloads are split at CPU-idle gaps and simulated in parallel.
         print_loading(f"Scheduling with {algo_name}")
-        if quantum is not None:
-            list_processes, schedule_table, metrics = algo_fn(processes, quantum)
+        instrumentation = None
+        if "--instrument" in sys.argv:
+            instrumentation = Instrumentation()
+            args = () if quantum is None else (quantum,)
+            list_processes, schedule_table, metrics = algo_fn(processes, *args, instrument=instrumentation)
         else:
-            list_processes, schedule_table, metrics = algo_fn(processes)
+            list_processes, schedule_table, metrics = result_cache.run(sharded(algo_fn), processes, quantum)
+        if isinstance(list_processes, ProcessTable):
+            # File workloads come back as a table: list it in completion order
+            list_processes = sorted(list_processes.to_processes(), key=lambda p: p.completion_time)
         
         # Display Results
         print_success(f"Scheduled {len(processes)} processes using {Color.BOLD}{algo_name}{Color.RESET}")
         print_schedule(schedule_table)
         print_process_stats(list_processes)
-        print_metrics(metrics)
+        print_metrics(metrics, instrumentation)
         
         # Output results
         output_choice = choose_output_method()
         save_results(output_choice, algo_name, list_processes, schedule_table, metrics)
     
+    elif mode == "sweep":
+        # Quantum sweep mode - offers its own CSV export
+        need_priority = True
+        processes = read_processes(need_priority)
+        
+        print_loading("Sweeping time quanta")
+        run_quantum_sweep(processes, Color)
+        print_success("Quantum sweep completed! Check above for results.")
+    
     else:
         # Comparison mode - no file output needed
         need_priority = True
@@ -1,4 +1,67 @@
+import functools
+from collections.abc import Iterator
+from typing import NamedTuple
+
+
+class ProcessSpec(NamedTuple):
+    """
+    Immutable description of a process: the part a workload file provides.
+
+    A list of specs can be shared read-only by any number of scheduler runs;
+    each run keeps its own mutable state in ProcessResult records.
+    """
+    pid: int
+    arrival_time: int
+    burst_time: int
+    priority: int = 0
+
+
+class ProcessResult:
+    """Compact per-run record for one ProcessSpec: scheduler state and output."""
+
+    __slots__ = ('spec', 'remaining_time', 'completion_time', 'waiting_time',
+                 'turnaround_time', 'response_time')
+
+    def __init__(self, spec: ProcessSpec):
+        self.spec = spec
+        self.remaining_time = spec.burst_time
+        self.completion_time = 0
+        self.waiting_time = 0
+        self.turnaround_time = 0
+        # response_time is only set by schedulers that record it
+
+    # Read-only views of the spec, so a result can stand in for a Process
+    @property
+    def pid(self):
+        return self.spec.pid
+
+    @property
+    def arrival_time(self):
+        return self.spec.arrival_time
+
+    @property
+    def burst_time(self):
+        return self.spec.burst_time
+
+    @property
+    def priority(self):
+        return self.spec.priority
+
+    def __str__(self):
+        return (f"Process ID: {self.pid}, "
+                f"Arrival: {self.arrival_time}, "
+                f"Burst: {self.burst_time}, "
+                f"Remaining: {self.remaining_time}, "
+                f"Turnaround: {self.turnaround_time}, "
+                f"Priority: {self.priority},"
+                f"Completion: {self.completion_time} ,"
+                f"Waiting: {self.waiting_time}")
+
+
 class Process:
+    __slots__ = ('pid', 'arrival_time', 'completion_time', 'priority', 'burst_time',
+                 'remaining_time', 'turnaround_time', 'waiting_time', 'response_time')
+
     def __init__(self, pid, arrival_time, burst_time,priority=0):
         # Unique process identifier
         self.pid = pid  
@@ -20,6 +83,13 @@ class Process:
 
         self.waiting_time = 0
 
+        # response_time is left unset until a scheduler records it
+
+    @property
+    def spec(self) -> ProcessSpec:
+        """Immutable snapshot of this process' input fields."""
+        return ProcessSpec(self.pid, self.arrival_time, self.burst_time, self.priority)
+
     def __str__(self):
         return (f"Process ID: {self.pid}, "
                 f"Arrival: {self.arrival_time}, "
@@ -29,3 +99,21 @@ class Process:
                 f"Priority: {self.priority},"
                 f"Completion: {self.completion_time} ,"
                 f"Waiting: {self.waiting_time}")
+
+
+def accepts_process_specs(scheduler):
+    """
+    Let a scheduler take ProcessSpec entries in its process list.
+
+    Each spec gets a fresh ProcessResult for this run, so the specs themselves
+    are never modified. Process objects are passed through (and updated) as before.
+    An iterator stays lazy: its entries are wrapped as the scheduler pulls them.
+    """
+    @functools.wraps(scheduler)
+    def wrapper(processes, *args, **kwargs):
+        if isinstance(processes, Iterator):
+            processes = (ProcessResult(p) if isinstance(p, ProcessSpec) else p for p in processes)
+        else:
+            processes = [ProcessResult(p) if isinstance(p, ProcessSpec) else p for p in processes]
+        return scheduler(processes, *args, **kwargs)
+    return wrapper
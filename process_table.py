@@ -0,0 +1,157 @@
+# Columnar Process Table
+#
+# A struct-of-arrays alternative to a List[Process]. Every Process attribute is
+# stored as one contiguous int64 NumPy array, so a workload costs 64 bytes per
+# process instead of one Python object per process, and metrics
+# are computed with vectorized reductions instead of generators over objects.
+
+import functools
+from multiprocessing import shared_memory
+from typing import List
+
+import numpy as np
+
+from process import Process, ProcessResult, ProcessSpec
+
+# Column order matches the Process attributes
+COLUMNS = (
+    "pid",
+    "arrival_time",
+    "burst_time",
+    "priority",
+    "remaining_time",
+    "completion_time",
+    "waiting_time",
+    "turnaround_time",
+)
+
+
+class ProcessTable:
+    """Workload stored as one int64 array per Process attribute (row i = process i)."""
+
+    __slots__ = COLUMNS
+
+    def __init__(self, pid, arrival_time, burst_time, priority=None):
+        """
+        Args:
+            pid, arrival_time, burst_time: Sequences (or arrays) of equal length
+            priority: Optional sequence of priorities, defaults to all 0
+        """
+        self.pid = np.ascontiguousarray(pid, dtype=np.int64)
+        n = len(self.pid)
+        self.arrival_time = np.ascontiguousarray(arrival_time, dtype=np.int64)
+        self.burst_time = np.ascontiguousarray(burst_time, dtype=np.int64)
+        if priority is None:
+            self.priority = np.zeros(n, dtype=np.int64)
+        else:
+            self.priority = np.ascontiguousarray(priority, dtype=np.int64)
+        if not (len(self.arrival_time) == len(self.burst_time) == len(self.priority) == n):
+            raise ValueError("All ProcessTable columns must have the same length")
+
+        # Scheduler output, filled in by a run
+        self.remaining_time = self.burst_time.copy()
+        self.completion_time = np.zeros(n, dtype=np.int64)
+        self.waiting_time = np.zeros(n, dtype=np.int64)
+        self.turnaround_time = np.zeros(n, dtype=np.int64)
+
+    @classmethod
+    def from_specs(cls, processes) -> "ProcessTable":
+        """Build a fresh (unscheduled) table from ProcessSpec or Process objects."""
+        n = len(processes)
+        return cls(*(np.fromiter((getattr(p, name) for p in processes), dtype=np.int64, count=n)
+                     for name in COLUMNS[:4]))
+
+    @classmethod
+    def from_processes(cls, processes: List[Process]) -> "ProcessTable":
+        """Build a table from Process objects, keeping their current result fields."""
+        table = cls.from_specs(processes)
+        table.store_results(processes)
+        return table
+
+    def to_processes(self) -> List[Process]:
+        """One Process per row, in row order, with the result fields copied over."""
+        processes = []
+        for row in zip(*(getattr(self, name).tolist() for name in COLUMNS)):
+            pid, arrival, burst, priority, remaining, completion, waiting, turnaround = row
+            p = Process(pid, arrival, burst, priority)
+            p.remaining_time = remaining
+            p.completion_time = completion
+            p.waiting_time = waiting
+            p.turnaround_time = turnaround
+            processes.append(p)
+        return processes
+
+    def to_shared_memory(self) -> shared_memory.SharedMemory:
+        """
+        Copy the input columns (pid, arrival, burst, priority) into a new
+        shared-memory block for worker processes. The caller closes and
+        unlinks it; workers map it with from_shared_memory(shm, len(table)).
+        """
+        n = len(self)
+        shm = shared_memory.SharedMemory(create=True, size=max(4 * n * 8, 1))
+        np.ndarray((4, n), dtype=np.int64, buffer=shm.buf)[:] = (
+            self.pid, self.arrival_time, self.burst_time, self.priority)
+        return shm
+
+    @classmethod
+    def from_shared_memory(cls, shm: shared_memory.SharedMemory, n: int) -> "ProcessTable":
+        """Fresh table whose input columns are read-only views of a to_shared_memory() block."""
+        columns = np.ndarray((4, n), dtype=np.int64, buffer=shm.buf)
+        columns.flags.writeable = False
+        return cls(*columns)
+
+    def to_specs(self) -> List[ProcessSpec]:
+        """One immutable ProcessSpec per row, in row order."""
+        return [ProcessSpec(*row) for row in zip(self.pid.tolist(), self.arrival_time.tolist(),
+                                                 self.burst_time.tolist(), self.priority.tolist())]
+
+    def store_results(self, processes):
+        """Copy result fields back from Process (or ProcessResult) objects given in row order."""
+        n = len(processes)
+        for name in COLUMNS[4:]:
+            getattr(self, name)[:] = np.fromiter((getattr(p, name) for p in processes),
+                                                 dtype=np.int64, count=n)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays."""
+        return sum(getattr(self, name).nbytes for name in COLUMNS)
+
+    def metrics(self):
+        """
+        Vectorized averages over a scheduled table.
+
+        Returns avg_waiting, avg_turnaround and cpu_utilisation (busy time over
+        makespan, with the clock starting at 0 as in every scheduler).
+        """
+        n = len(self)
+        if not n:
+            return {"avg_waiting": 0, "avg_turnaround": 0, "cpu_utilisation": 0}
+        # Sum as Python ints so the averages match the schedulers' own stats exactly
+        makespan = int(self.completion_time.max())
+        return {
+            "avg_waiting": int(self.waiting_time.sum()) / n,
+            "avg_turnaround": int(self.turnaround_time.sum()) / n,
+            "cpu_utilisation": 100 * int(self.burst_time.sum()) / makespan if makespan else 0,
+        }
+
+
+def accepts_process_table(scheduler):
+    """
+    Let a scheduler take a ProcessTable wherever it takes a List[Process].
+
+    The table's result columns are filled in and the table itself is returned
+    in place of the completed-process list; schedule and stats are unchanged.
+    """
+    @functools.wraps(scheduler)
+    def wrapper(processes, *args, **kwargs):
+        if not isinstance(processes, ProcessTable):
+            return scheduler(processes, *args, **kwargs)
+        rows = [ProcessResult(spec) for spec in processes.to_specs()]
+        _, schedule, stats = scheduler(rows, *args, **kwargs)
+        processes.store_results(rows)
+        return processes, schedule, stats
+    return wrapper
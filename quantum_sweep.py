@@ -0,0 +1,216 @@
+# Quantum Sweep Module
+#
+# Runs Round-Robin and Priority + Round-Robin over a range of time quanta on
+# the same workload and collects the metric curves (waiting, turnaround and
+# response time, context switches) in one tidy DataFrame, with the knee of
+# each curve marked. Quanta are evaluated in parallel across CPU cores.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from algorithms.round_robin import round_robin
+from algorithms.priority_rr import priority_round_robin
+from process_table import ProcessTable
+
+# Algorithms that take a quantum, keyed by the name used in the results
+SWEEP_ALGORITHMS = {
+    "round_robin": round_robin,
+    "priority_round_robin": priority_round_robin,
+}
+
+# Below this many (process x run) simulations the pool start-up costs more than it saves
+PARALLEL_MIN_WORK = 200_000
+
+
+def count_context_switches(schedule):
+    """
+    Number of times the CPU passes from one process to a different one.
+
+    Works on compress_rounds schedules without expanding them: inside a
+    round entry every slice goes to the next pid of the rotation.
+    """
+    switches = 0
+    last = None
+    for row in schedule:
+        if 'rounds' in row:
+            pids = row['pids']
+            if last is not None and pids[0] != last:
+                switches += 1
+            if len(pids) > 1:
+                switches += row['rounds'] * len(pids) - 1
+            last = pids[-1]
+        else:
+            if last is not None and row['pid'] != last:
+                switches += 1
+            last = row['pid']
+    return switches
+
+
+def find_knee(x, y):
+    """
+    Index of the knee of the curve y(x), or None for a straight/flat curve.
+
+    Both axes are scaled to [0, 1] and the knee is the point farthest from
+    the chord joining the first and last points (the "Kneedle" heuristic).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) < 3 or x[-1] == x[0] or y.max() == y.min():
+        return None
+    xs = (x - x[0]) / (x[-1] - x[0])
+    ys = (y - y.min()) / (y.max() - y.min())
+    chord = ys[0] + (ys[-1] - ys[0]) * xs
+    distance = np.abs(ys - chord)
+    knee = int(distance.argmax())
+    return knee if distance[knee] > 0 else None
+
+
+def _sweep_point(specs, algorithm, quantum):
+    """One simulation of the sweep; returns its row of the results table."""
+    # Round entries keep the schedule small even for tiny quanta
+    _, schedule, stats = SWEEP_ALGORITHMS[algorithm](specs, quantum, compress_rounds=True)
+    return {
+        "algorithm": algorithm,
+        "quantum": quantum,
+        "avg_waiting": stats["avg_waiting"],
+        "avg_turnaround": stats["avg_turnaround"],
+        "avg_response": stats["avg_response"],
+        "context_switches": count_context_switches(schedule),
+    }
+
+
+# Worker-side workload, built once per pool process
+_worker_specs = None
+
+
+def _load_workload(shm_name, n):
+    """Pool initializer: read the shared, pre-sorted workload once."""
+    global _worker_specs
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_specs = ProcessTable.from_shared_memory(shm, n).to_specs()
+    shm.close()
+
+
+def _sweep_in_worker(task):
+    """Pool task: one (algorithm, quantum) point on the worker's workload."""
+    return _sweep_point(_worker_specs, *task)
+
+
+def sweep_quanta(processes, quanta=range(1, 513), algorithms=tuple(SWEEP_ALGORITHMS),
+                 workers=None, knee_metric="context_switches"):
+    """
+    Evaluate quantum-based schedulers for every quantum in `quanta`.
+
+    Args:
+        processes: List of Process / ProcessSpec objects, or a ProcessTable
+        quanta: Time quanta to try (positive integers)
+        algorithms: Keys of SWEEP_ALGORITHMS to run
+        workers: Pool size (default: CPU count); 1 runs everything in this process
+        knee_metric: Column whose curve decides the knee of each algorithm
+
+    Returns:
+        DataFrame with one row per (algorithm, quantum): avg_waiting,
+        avg_turnaround, avg_response, context_switches and a boolean `knee`
+        column marking the knee of `knee_metric` for each algorithm.
+
+    The workload is sorted by arrival once up front, so every run's own
+    arrival sort is a linear pass over already-ordered data.
+    """
+    quanta = sorted(set(int(q) for q in quanta))
+    if not quanta or quanta[0] <= 0:
+        raise ValueError("Quanta must be positive integers")
+    for algorithm in algorithms:
+        if algorithm not in SWEEP_ALGORITHMS:
+            raise ValueError(f"Unknown sweep algorithm: {algorithm}")
+
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_specs(processes)
+    order = np.argsort(processes.arrival_time, kind="stable")
+    workload = ProcessTable(processes.pid[order], processes.arrival_time[order],
+                            processes.burst_time[order], processes.priority[order])
+
+    tasks = list(product(algorithms, quanta))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(workload) * len(tasks) >= PARALLEL_MIN_WORK:
+        shm = workload.to_shared_memory()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_load_workload,
+                                     initargs=(shm.name, len(workload))) as pool:
+                chunksize = max(1, len(tasks) // (workers * 4))
+                rows = list(pool.map(_sweep_in_worker, tasks, chunksize=chunksize))
+        finally:
+            shm.close()
+            shm.unlink()
+    else:
+        specs = workload.to_specs()
+        rows = [_sweep_point(specs, algorithm, quantum) for algorithm, quantum in tasks]
+
+    results = pd.DataFrame(rows, columns=["algorithm", "quantum", "avg_waiting", "avg_turnaround",
+                                          "avg_response", "context_switches"])
+    results["knee"] = False
+    for _, group in results.groupby("algorithm", sort=False):
+        knee = find_knee(group["quantum"], group[knee_metric])
+        if knee is not None:
+            results.loc[group.index[knee], "knee"] = True
+    return results
+
+
+def run_quantum_sweep(processes, color):
+    """Interactive sweep: pick algorithms and a quantum range, show and export the curves"""
+    print(f"\n{color.CYAN}{color.BOLD}{'═' * 5} Quantum Sweep {'═' * 40}{color.RESET}")
+    print(f"  {color.CYAN}1{color.RESET}) {color.BOLD}Round-Robin{color.RESET}")
+    print(f"  {color.CYAN}2{color.RESET}) {color.BOLD}Priority + Round-Robin{color.RESET}")
+    print(f"  {color.CYAN}3{color.RESET}) {color.BOLD}Both{color.RESET}")
+    choices = {"1": ("round_robin",), "2": ("priority_round_robin",), "3": tuple(SWEEP_ALGORITHMS)}
+    while True:
+        choice = input(f"{color.BOLD}{color.BLUE}➜ {color.RESET}Algorithms to sweep: {color.GREEN}").strip()
+        print(color.RESET, end="")
+        if choice in choices:
+            algorithms = choices[choice]
+            break
+        print(f"{color.RED}✗ Invalid option – try again.{color.RESET}")
+
+    while True:
+        answer = input(f"{color.BOLD}{color.BLUE}➜ {color.RESET}Quantum range 'min max' (default: 1 512): {color.GREEN}").strip()
+        print(color.RESET, end="")
+        try:
+            low, high = (int(v) for v in answer.split()) if answer else (1, 512)
+        except ValueError:
+            print(f"{color.RED}✗ Please enter two numbers{color.RESET}")
+            continue
+        if 0 < low <= high:
+            break
+        print(f"{color.YELLOW}⚠️  Need 0 < min <= max{color.RESET}")
+
+    results = sweep_quanta(processes, range(low, high + 1), algorithms)
+
+    for algorithm, group in results.groupby("algorithm", sort=False):
+        print(f"\n{color.CYAN}{color.BOLD}{'═' * 5} {algorithm} {'═' * (45 - len(algorithm))}{color.RESET}")
+        rows = []
+        for row in group.itertuples():
+            cells = [row.quantum, f"{row.avg_waiting:.2f}", f"{row.avg_turnaround:.2f}",
+                     f"{row.avg_response:.2f}", row.context_switches]
+            if row.knee:
+                cells = [f"{color.YELLOW}{color.BOLD}{cell}{color.RESET}" for cell in cells] + ["◀ knee"]
+            rows.append(cells)
+        print(tabulate(rows, headers=["Quantum", "Avg. Waiting", "Avg. Turnaround",
+                                      "Avg. Response", "Context Switches", ""],
+                       tablefmt="simple", numalign="right"))
+        knee = group[group["knee"]]
+        if not knee.empty:
+            print(f"{color.GREEN}Knee:{color.RESET} quantum {color.BOLD}{knee['quantum'].iloc[0]}{color.RESET}")
+
+    filename = input(f"{color.BLUE}➜ Save as CSV (blank to skip): {color.GREEN}").strip()
+    print(color.RESET, end="")
+    if filename:
+        results.to_csv(filename, index=False)
+        print(f"{color.GREEN}✓ Saved to {filename}{color.RESET}")
+
+    return results
@@ -0,0 +1,337 @@
+# Scheduler Result Cache
+#
+# Uploaded workloads are often run through the same algorithm again and again
+# (web /run, main.py, comparison mode). ResultCache remembers each run under a
+# content hash of (workload, algorithm, quantum, parameters) so a repeat costs
+# one hash plus a lookup. Entries keep per-process results as int64 columns,
+# the stats and, optionally, the compact Schedule. Recent entries live in a
+# byte-bounded in-memory LRU; every entry is also written to a directory so
+# later sessions start warm.
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+
+from process import ProcessResult, ProcessSpec
+from process_table import ProcessTable
+from schedule import Schedule
+
+# Bump when a scheduler change alters results, so old entries stop matching
+CACHE_VERSION = 1
+
+# A full on-disk tier is trimmed down to this fraction of its budget
+DISK_TRIM_TARGET = 0.9
+
+# Set SCHEDULER_CACHE_DIR to move the on-disk tier, or to "" to turn it off
+DEFAULT_CACHE_DIR = os.environ.get(
+    "SCHEDULER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "cpu_scheduler")) or None
+
+
+def workload_digest(processes) -> str:
+    """
+    SHA-256 of a workload's input fields (pid, arrival, burst, priority).
+
+    Row order is part of the hash: it breaks arrival-time ties in every scheduler.
+    """
+    if not isinstance(processes, ProcessTable):
+        processes = ProcessTable.from_specs(processes)
+    digest = hashlib.sha256(len(processes).to_bytes(8, "little"))
+    for column in (processes.pid, processes.arrival_time, processes.burst_time, processes.priority):
+        digest.update(column.astype("<i8", copy=False).tobytes())
+    return digest.hexdigest()
+
+
+def _copy_schedule(schedule):
+    """Independent copy of a scheduler's schedule (Schedule, list of dicts or None)."""
+    if isinstance(schedule, Schedule):
+        return schedule.copy()
+    return copy.deepcopy(schedule)
+
+
+class CachedRun(NamedTuple):
+    """
+    One scheduler run, independent of the objects it ran on.
+
+    order lists input rows in completion order; completion, waiting,
+    turnaround and response follow the same order (response is None when the
+    scheduler does not record it).
+    """
+    order: np.ndarray
+    completion: np.ndarray
+    waiting: np.ndarray
+    turnaround: np.ndarray
+    response: Optional[np.ndarray]
+    schedule: Optional[Schedule]
+    stats: Dict[str, float]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.order, self.completion, self.waiting, self.turnaround, self.response)
+        size = sum(a.nbytes for a in arrays if a is not None)
+        if isinstance(self.schedule, Schedule):
+            size += self.schedule.nbytes
+        return size + 1024   # stats dict and bookkeeping
+
+    @classmethod
+    def from_rows(cls, rows, completed, schedule, stats) -> "CachedRun":
+        """Capture a run over `rows` (the list actually passed to the scheduler)."""
+        index = {id(row): i for i, row in enumerate(rows)}
+        order = np.fromiter((index[id(p)] for p in completed), dtype=np.int64, count=len(completed))
+        responses = [getattr(p, "response_time", None) for p in completed]
+        response = None if None in responses else np.array(responses, dtype=np.int64)
+        return cls(
+            order,
+            np.fromiter((p.completion_time for p in completed), dtype=np.int64, count=len(completed)),
+            np.fromiter((p.waiting_time for p in completed), dtype=np.int64, count=len(completed)),
+            np.fromiter((p.turnaround_time for p in completed), dtype=np.int64, count=len(completed)),
+            response, schedule, dict(stats))
+
+    @classmethod
+    def from_table(cls, table: ProcessTable, schedule, stats) -> "CachedRun":
+        """Capture a run that filled in a ProcessTable (ties keep row order)."""
+        order = np.argsort(table.completion_time, kind="stable")
+        return cls(order, table.completion_time[order], table.waiting_time[order],
+                   table.turnaround_time[order], None, schedule, dict(stats))
+
+    def apply(self, processes):
+        """
+        Fill the results into a fresh workload, as the scheduler would have.
+
+        Returns (completed, schedule, stats) like a scheduler call: a
+        ProcessTable comes back filled in, a list comes back in completion
+        order (ProcessSpec entries get ProcessResult records).
+        """
+        if isinstance(processes, ProcessTable):
+            processes.remaining_time[:] = 0
+            processes.completion_time[self.order] = self.completion
+            processes.waiting_time[self.order] = self.waiting
+            processes.turnaround_time[self.order] = self.turnaround
+            return processes, self.schedule, dict(self.stats)
+
+        rows = [ProcessResult(p) if isinstance(p, ProcessSpec) else p for p in processes]
+        completed = [rows[i] for i in self.order.tolist()]
+        columns = [self.completion.tolist(), self.waiting.tolist(), self.turnaround.tolist()]
+        for proc, completion, waiting, turnaround in zip(completed, *columns):
+            proc.remaining_time = 0
+            proc.completion_time = completion
+            proc.waiting_time = waiting
+            proc.turnaround_time = turnaround
+        if self.response is not None:
+            for proc, response in zip(completed, self.response.tolist()):
+                proc.response_time = response
+        return completed, self.schedule, dict(self.stats)
+
+
+class ResultCache:
+    """
+    Content-addressed cache of scheduler runs: in-memory LRU over an on-disk store.
+
+    Counters: hits (memory), disk_hits and misses.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20, directory: Optional[str] = DEFAULT_CACHE_DIR,
+                 max_disk_bytes: int = 2**30):
+        """
+        Args:
+            max_bytes: Budget of the in-memory tier (least recently used entries go first)
+            directory: Where entries persist between sessions; None keeps them in memory only
+            max_disk_bytes: Budget of the on-disk tier (oldest files go first)
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, CachedRun]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_bytes = None      # Size of the on-disk tier, measured on the first write
+        self._disk_lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(algo_fn, digest: str, quantum=None, table: bool = False, **params) -> str:
+        """
+        Cache key for running `algo_fn` on the workload with `digest`.
+
+        `table` marks runs over a ProcessTable: their entries hold no response
+        times, so they are kept apart from runs over a list of processes.
+        """
+        description = json.dumps({
+            "version": CACHE_VERSION,
+            "algorithm": f"{algo_fn.__module__}.{algo_fn.__qualname__}",
+            "workload": digest,
+            "quantum": quantum,
+            "table": table,
+            "params": params,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def counters(self) -> Dict[str, int]:
+        """Hit/miss counters and the current size of the memory tier."""
+        with self._lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "entries": len(self._entries), "bytes": self._bytes}
+
+    def clear(self):
+        """Drop the in-memory tier (the on-disk tier is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ---------------- lookup / store ----------------
+    def get(self, key: str, need_schedule: bool = False) -> Optional[CachedRun]:
+        """Entry for `key`, or None (counted as a miss). need_schedule skips entries stored without one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.schedule is not None or not need_schedule):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read(key)
+        with self._lock:
+            if entry is not None and (entry.schedule is not None or not need_schedule):
+                self.disk_hits += 1
+                self._remember(key, entry)
+                return entry
+            self.misses += 1
+            return None
+
+    def put(self, key: str, entry: CachedRun):
+        """Store `entry` in both tiers."""
+        with self._lock:
+            self._remember(key, entry)
+        self._write(key, entry)
+
+    def run(self, algo_fn, processes, quantum=None, metrics_only: bool = False, progress=None, **params):
+        """
+        Call `algo_fn` the way a scheduler is called, unless the result is cached.
+
+        `processes` must be fresh (not yet scheduled), as for any scheduler run.
+        `progress` is passed on to algo_fn (it is not part of the key) and
+        told the run is complete on a hit.
+        Returns (completed, schedule, stats) exactly like algo_fn. The schedule
+        is always the caller's own copy: the cache keeps a separate one, so
+        editing or appending to it cannot change later hits.
+        """
+        key = self.key(algo_fn, workload_digest(processes), quantum,
+                       table=isinstance(processes, ProcessTable), **params)
+        entry = self.get(key, need_schedule=not metrics_only)
+        if entry is not None:
+            completed, schedule, stats = entry.apply(processes)
+            if progress is not None:
+                progress(len(processes), len(processes))
+            return completed, None if metrics_only else _copy_schedule(schedule), stats
+
+        args = () if quantum is None else (quantum,)
+        if progress is not None:
+            params = dict(params, progress=progress)
+        if isinstance(processes, ProcessTable):
+            completed, schedule, stats = algo_fn(processes, *args, metrics_only=metrics_only, **params)
+            entry = CachedRun.from_table(processes, _copy_schedule(schedule), stats)
+        else:
+            rows = [ProcessResult(p) if isinstance(p, ProcessSpec) else p for p in processes]
+            completed, schedule, stats = algo_fn(rows, *args, metrics_only=metrics_only, **params)
+            entry = CachedRun.from_rows(rows, completed, _copy_schedule(schedule), stats)
+        self.put(key, entry)
+        return completed, schedule, stats
+
+    # ---------------- tiers ----------------
+    def _remember(self, key, entry):
+        """Insert into the memory tier and evict down to max_bytes (lock held)."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += entry.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _read(self, key) -> Optional[CachedRun]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            os.utime(path)   # recently used files are evicted last
+            return entry
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _write(self, key, entry):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self._wrote(os.path.getsize(path) - replaced)
+        except OSError:
+            pass   # the disk tier is best effort; the memory tier still has the entry
+
+    def _scan_disk(self):
+        """(mtime, size, path) of every entry file in the on-disk tier."""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".pkl"):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue   # removed by another process meanwhile
+                    files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def _wrote(self, delta):
+        """Add `delta` bytes to the running size of the on-disk tier and trim it once over budget."""
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                # First write of this session: measure what earlier ones left (includes this file)
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            else:
+                self._disk_bytes += delta
+            if self._disk_bytes > self.max_disk_bytes:
+                self._trim_disk()
+
+    def _trim_disk(self):
+        """
+        Delete the least recently used files until the directory is down to
+        DISK_TRIM_TARGET of max_disk_bytes, so a full tier is not rescanned on
+        every write. Re-measures the running size (other processes write too).
+        """
+        files = self._scan_disk()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= DISK_TRIM_TARGET * self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
+
+
+# Shared by main.py, the comparison mode and the web interface
+result_cache = ResultCache()
@@ -0,0 +1,140 @@
+# Columnar Schedule
+#
+# Schedulers used to return the timeline as a list of {'pid', 'start', 'finish'}
+# dicts, roughly 200+ bytes per segment. Schedule keeps the same data in three
+# growable int64 arrays (24 bytes per segment, plus one flag byte) and still
+# behaves like the old list for existing callers: len(), indexing and iteration
+# all yield the familiar dicts.
+
+from array import array
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+import pandas as pd
+
+
+class Schedule:
+    """Execution segments stored as parallel pid / start / finish int64 arrays."""
+
+    __slots__ = ("pid", "start", "finish", "preempted")
+
+    def __init__(self):
+        self.pid = array("q")
+        self.start = array("q")
+        self.finish = array("q")
+        # 1 where the segment was cut short by pre-emption (shown as 'turnaround': None)
+        self.preempted = bytearray()
+
+    def append(self, pid, start, finish, preempted=False):
+        """Record one execution segment."""
+        self.pid.append(pid)
+        self.start.append(start)
+        self.finish.append(finish)
+        self.preempted.append(1 if preempted else 0)
+
+    @classmethod
+    def from_arrays(cls, pid, start, finish) -> "Schedule":
+        """Build a schedule from equal-length integer sequences or NumPy arrays."""
+        schedule = cls()
+        for column, values in ((schedule.pid, pid), (schedule.start, start), (schedule.finish, finish)):
+            if hasattr(values, "astype"):
+                column.frombytes(values.astype("int64").tobytes())
+            else:
+                column.extend(values)
+        schedule.preempted = bytearray(len(schedule.pid))
+        return schedule
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "Schedule":
+        """Build a schedule from the old list-of-dicts format."""
+        schedule = cls()
+        for row in records:
+            schedule.append(row["pid"], row["start"], row["finish"],
+                            "turnaround" in row and row["turnaround"] is None)
+        return schedule
+
+    @classmethod
+    def concatenate(cls, parts: Iterable["Schedule"]) -> "Schedule":
+        """One schedule made of `parts` back to back (in the given order)."""
+        schedule = cls()
+        for part in parts:
+            schedule.pid.extend(part.pid)
+            schedule.start.extend(part.start)
+            schedule.finish.extend(part.finish)
+            schedule.preempted.extend(part.preempted)
+        return schedule
+
+    def copy(self) -> "Schedule":
+        """An independent copy (appending to one leaves the other alone)."""
+        return Schedule.concatenate([self])
+
+    # ---------------- list-of-dicts compatibility ----------------
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def _row(self, i) -> dict:
+        row = {"pid": self.pid[i], "start": self.start[i], "finish": self.finish[i]}
+        if self.preempted[i]:
+            row["turnaround"] = None  # None indicates preemption
+        return row
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Schedule index out of range")
+        return self._row(i)
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def __eq__(self, other):
+        if isinstance(other, Schedule):
+            return (self.pid == other.pid and self.start == other.start
+                    and self.finish == other.finish and self.preempted == other.preempted)
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def to_list(self) -> List[dict]:
+        """The schedule as a list of dicts (JSON-serialisable)."""
+        return list(self)
+
+    # ---------------- compact views ----------------
+    @property
+    def makespan(self) -> int:
+        """Finish time of the last segment (0 for an empty schedule)."""
+        return max(self.finish) if self.finish else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column buffers."""
+        return (self.pid.itemsize * len(self.pid) * 3) + len(self.preempted)
+
+    def merged(self) -> "Schedule":
+        """Copy with back-to-back segments of the same pid joined into one."""
+        merged = Schedule()
+        for pid, start, finish, preempted in zip(self.pid, self.start, self.finish, self.preempted):
+            if (merged.pid and merged.pid[-1] == pid and merged.finish[-1] == start
+                    and not merged.preempted[-1]):
+                merged.finish[-1] = finish
+                merged.preempted[-1] = preempted
+            else:
+                merged.append(pid, start, finish, preempted)
+        return merged
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy NumPy views of the columns: {'pid', 'start', 'finish'}.
+
+        The views share memory with the schedule, which cannot grow while they exist.
+        """
+        return {name: np.frombuffer(getattr(self, name), dtype=np.int64)
+                for name in ("pid", "start", "finish")}
+
+    def to_dataframe(self):
+        """pandas DataFrame with pid / start / finish columns built on the NumPy views."""
+        return pd.DataFrame(self.to_numpy(), copy=False)
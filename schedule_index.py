@@ -0,0 +1,219 @@
+# Schedule Time Index
+#
+# A Gantt chart of a long run cannot draw every segment: at 10^5+ segments
+# the browser spends its time on DOM nodes narrower than a pixel. ScheduleIndex
+# is built once from a scheduler's schedule and answers "what is visible
+# between t0 and t1 at this pixel width". On a single CPU no two segments
+# overlap, so both the start and the finish column are sorted and the
+# segments touching a window are found with two binary searches. Segments at
+# least a pixel wide come back as they are; narrower ones are summed into
+# one bucket per pixel with the time each process held the CPU there. A
+# query costs O(log n + visible) and its answer has O(width) entries.
+#
+# The same sorted columns answer point-in-time questions ("which pid held
+# the CPU at t") in O(log n), and a per-pid offset table (segments grouped
+# by pid, in time order) answers per-process ones ("segments of pid X in
+# [a, b]", "last run of each pid by t"). The batch forms take NumPy arrays
+# and do all lookups in one vectorized search.
+#
+#     index = ScheduleIndex(schedule)
+#     index.pid_at([0, 5, 10])            # array([ 1,  2, -1]); -1 = idle
+#     index.segments_of(2, 0, 100)        # positions of pid 2's segments
+#     index.start[index.segments_of(2)]   # ... and their start times
+
+from typing import List
+
+import numpy as np
+
+from schedule import Schedule
+
+# Processes listed per bucket (the ones that held the CPU longest in it)
+BUCKET_PIDS = 3
+
+# Returned by pid_at (and as a segment position) when the CPU is idle or nothing matches
+IDLE = -1
+
+
+def _columns(schedule):
+    """(pid, start, finish, preempted) int64 arrays of a Schedule or of scheduler records."""
+    if isinstance(schedule, Schedule):
+        columns = schedule.to_numpy()
+        return (columns["pid"].copy(), columns["start"].copy(), columns["finish"].copy(),
+                np.frombuffer(bytes(schedule.preempted), dtype=np.uint8).astype(np.int64))
+
+    pid, start, finish, preempted = [], [], [], []
+    for row in schedule:
+        if "rounds" not in row:
+            pid.append(row["pid"])
+            start.append(row["start"])
+            finish.append(row["finish"])
+            preempted.append(1 if "turnaround" in row and row["turnaround"] is None else 0)
+            continue
+        # Compressed rounds: every listed pid runs one quantum per round, in order
+        slices = row["rounds"] * len(row["pids"])
+        quantum = (row["finish"] - row["start"]) // slices
+        pid.extend(row["pids"] * row["rounds"])
+        start.extend(range(row["start"], row["finish"], quantum))
+        finish.extend(range(row["start"] + quantum, row["finish"] + 1, quantum))
+        preempted.extend([0] * slices)
+    return tuple(np.array(column, dtype=np.int64) for column in (pid, start, finish, preempted))
+
+
+class ScheduleIndex:
+    """
+    Single-CPU schedule sorted by start time, for time-window and point queries.
+
+    Segment positions returned by the queries index the pid / start / finish
+    / preempted columns (segments in start order). Per-pid tables: pids
+    (sorted distinct pids), by_pid (segment positions grouped by pid, in time
+    order) and offsets (pid pids[k] owns by_pid[offsets[k]:offsets[k + 1]]).
+    """
+
+    __slots__ = ("pid", "start", "finish", "preempted", "pids", "offsets", "by_pid", "_stride", "_keys")
+
+    def __init__(self, schedule):
+        """
+        Args:
+            schedule: Schedule or list of records as returned by any scheduler
+                (compressed rounds are expanded)
+        """
+        pid, start, finish, preempted = _columns(schedule)
+        order = np.argsort(start, kind="stable")
+        self.pid = pid[order]
+        self.start = start[order]
+        self.finish = finish[order]
+        self.preempted = preempted[order].astype(bool)
+
+        self.by_pid = np.argsort(self.pid, kind="stable")
+        self.pids, counts = np.unique(self.pid, return_counts=True)
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        # Sorted (slot, start) keys for last_segment: slots spaced wider than any
+        # time, so one search covers every pid (None if they would overflow)
+        self._stride = (int(self.finish[-1]) if len(self) else 0) + 2
+        self._keys = None
+        if len(self.pids) * self._stride < 2**62:
+            self._keys = (np.repeat(np.arange(len(self.pids), dtype=np.int64) * self._stride, counts)
+                          + self.start[self.by_pid] + 1)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    @property
+    def makespan(self) -> int:
+        """Finish time of the last segment (0 for an empty schedule)."""
+        return int(self.finish[-1]) if len(self) else 0
+
+    def span(self, t0, t1):
+        """Index range [lo, hi) of the segments overlapping the time window [t0, t1)."""
+        lo = int(np.searchsorted(self.finish, t0, side="right"))
+        hi = int(np.searchsorted(self.start, t1, side="left"))
+        return lo, max(lo, hi)
+
+    # ---------------- point queries ----------------
+    def segment_at(self, times) -> np.ndarray:
+        """Position of the segment running at each of `times` (IDLE where the CPU is idle)."""
+        times = np.asarray(times)
+        position = np.searchsorted(self.start, times, side="right") - 1
+        running = (position >= 0) & (times < self.finish[np.maximum(position, 0)])
+        return np.where(running, position, IDLE)
+
+    def pid_at(self, times) -> np.ndarray:
+        """Pid holding the CPU at each of `times` (IDLE where the CPU is idle)."""
+        position = self.segment_at(times)
+        return np.where(position >= 0, self.pid[np.maximum(position, 0)], IDLE)
+
+    # ---------------- per-process queries ----------------
+    def _pid_slot(self, pids):
+        """(slot in self.pids, found) for each pid."""
+        pids = np.asarray(pids)
+        slot = np.minimum(np.searchsorted(self.pids, pids), max(len(self.pids) - 1, 0))
+        found = (self.pids[slot] == pids) if len(self.pids) else np.zeros(pids.shape, dtype=bool)
+        return slot, found
+
+    def segments_of(self, pid, t0=None, t1=None) -> np.ndarray:
+        """
+        Positions of `pid`'s segments overlapping [t0, t1), in time order
+        (all of them when the bounds are omitted; empty for an unknown pid).
+        """
+        slot, found = self._pid_slot(pid)
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        own = self.by_pid[self.offsets[slot]:self.offsets[slot + 1]]
+        lo = 0 if t0 is None else np.searchsorted(self.finish[own], t0, side="right")
+        hi = len(own) if t1 is None else np.searchsorted(self.start[own], t1, side="left")
+        return own[lo:max(lo, hi)]
+
+    def last_segment(self, pids, times) -> np.ndarray:
+        """
+        For each (pid, time) pair (broadcast together), the position of the
+        pid's last segment starting at or before that time, or IDLE if it has
+        not run yet. The pid is running then if time < finish[position].
+        """
+        pids, times = np.broadcast_arrays(np.asarray(pids), np.asarray(times))
+        slot, found = self._pid_slot(pids)
+        if not len(self):
+            return np.full(pids.shape, IDLE, dtype=np.int64)
+        if self._keys is not None:
+            # Starts are integers: start <= t exactly when start <= floor(t)
+            times = np.clip(np.floor(times), -1, self._stride - 2).astype(np.int64)
+            count = np.searchsorted(self._keys, slot * self._stride + times + 1, side="right") - self.offsets[slot]
+        else:
+            starts = self.start[self.by_pid]
+            count = np.array([np.searchsorted(starts[self.offsets[k]:self.offsets[k + 1]], t, side="right")
+                              for k, t in zip(slot.ravel().tolist(), times.ravel().tolist())],
+                             dtype=np.int64).reshape(pids.shape)
+        last = self.by_pid[np.maximum(self.offsets[slot] + count - 1, 0)]
+        return np.where(found & (count > 0), last, IDLE)
+
+    # ---------------- windows ----------------
+    def window(self, t0, t1, width: int) -> dict:
+        """
+        What a chart `width` pixels wide shows of [t0, t1).
+
+        Returns:
+            dict with start, end, width, unit (time per pixel) and
+            - segments: {'pid', 'start', 'finish', 'preempted'} for each
+              segment at least one pixel wide
+            - buckets: {'start', 'finish', 'busy', 'pids'} for each pixel
+              holding narrower segments; busy is the CPU time they cover and
+              pids lists up to BUCKET_PIDS [pid, time] pairs, longest first
+              (a segment counts towards the pixel it starts in)
+        """
+        unit = (t1 - t0) / width
+        lo, hi = self.span(t0, t1)
+        pid, start, finish = self.pid[lo:hi], self.start[lo:hi], self.finish[lo:hi]
+        wide = (finish - start) >= unit
+
+        segments = [{"pid": p, "start": s, "finish": f, "preempted": c}
+                    for p, s, f, c in zip(pid[wide].tolist(), start[wide].tolist(),
+                                          finish[wide].tolist(), self.preempted[lo:hi][wide].tolist())]
+        return {"start": t0, "end": t1, "width": width, "unit": unit,
+                "segments": segments,
+                "buckets": self._buckets(pid[~wide], start[~wide], finish[~wide], t0, t1, unit, width)}
+
+    @staticmethod
+    def _buckets(pid, start, finish, t0, t1, unit, width) -> List[dict]:
+        """Per-pixel occupancy of sub-pixel segments (see window)."""
+        if not len(pid):
+            return []
+        time = np.minimum(finish, t1) - np.maximum(start, t0)
+        bucket = np.clip(((np.maximum(start, t0) - t0) / unit).astype(np.int64), 0, width - 1)
+
+        # Total time per (bucket, pid), then each bucket's pids longest first
+        order = np.lexsort((pid, bucket))
+        bucket, pid, time = bucket[order], pid[order], time[order]
+        first = np.flatnonzero(np.r_[True, (bucket[1:] != bucket[:-1]) | (pid[1:] != pid[:-1])])
+        bucket, pid, time = bucket[first], pid[first], np.add.reduceat(time, first)
+        order = np.lexsort((-time, bucket))
+        bucket, pid, time = bucket[order], pid[order], time[order]
+
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        busy = np.add.reduceat(time, starts)
+        ends = np.r_[starts[1:], len(bucket)]
+        buckets = []
+        for b, s, e, total in zip(bucket[starts].tolist(), starts.tolist(), ends.tolist(), busy.tolist()):
+            e = min(e, s + BUCKET_PIDS)
+            buckets.append({"start": t0 + b * unit, "finish": t0 + (b + 1) * unit, "busy": total,
+                            "pids": [[p, t] for p, t in zip(pid[s:e].tolist(), time[s:e].tolist())]})
+        return buckets
@@ -0,0 +1,186 @@
+# Sharded Simulation
+#
+# Every scheduler in algorithms/ is work-conserving: the CPU only idles when
+# nothing is ready. So whenever a process arrives after everything before it
+# has finished, the CPU is idle, the ready queue is empty and the rest of the
+# run cannot depend on what came before. The FCFS cumulative-sum scan
+# (fcfs_arrays) gives, for every arrival-sorted position, when all earlier
+# work is done. Positions that arrive strictly later are independent starting
+# points. The workload is cut at a balanced subset of these busy-period
+# boundaries, the shards run in parallel worker processes, and the results are
+# stitched back together. Per-process results and the schedule are the ones
+# the sequential run produces, and the stats are recomputed from integer sums
+# the same way the schedulers compute them, so they are bit-identical too.
+
+import functools
+import inspect
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List
+
+import numpy as np
+
+from algorithms.fcfs import fcfs_arrays
+from process import ProcessResult
+from process_table import ProcessTable
+from result_cache import CachedRun
+from schedule import Schedule
+
+# Below this many processes the pool start-up costs more than it saves
+SHARD_MIN_PROCESSES = 50_000
+
+# Shards per worker: several, so one long busy period does not leave the rest idle
+SHARDS_PER_WORKER = 4
+
+
+def busy_period_starts(arrival, burst) -> np.ndarray:
+    """
+    Positions (in the given arrival-sorted order) where a new busy period begins.
+
+    Position 0 always starts one; position i does when it arrives after the
+    last of processes 0..i-1 has finished, i.e. after an idle gap.
+    """
+    n = len(arrival)
+    if not n:
+        return np.zeros(0, dtype=np.int64)
+    finish = fcfs_arrays(arrival, burst)["finish"]
+    starts = np.flatnonzero(np.asarray(arrival)[1:] > finish[:-1]) + 1
+    return np.concatenate(([0], starts)).astype(np.int64)
+
+
+def plan_shards(starts, n, shards) -> List[int]:
+    """
+    Shard boundaries [0, c1, ..., n] picked among busy-period starts so that
+    shards hold about n / shards processes each (fewer shards when there are
+    not enough boundaries).
+    """
+    targets = np.arange(1, shards) * n / shards
+    picked = starts[np.minimum(np.searchsorted(starts, targets), len(starts) - 1)]
+    cuts = np.unique(picked[picked > 0])
+    return [0, *cuts.tolist(), n]
+
+
+# Worker-side workload, built once per pool process
+_worker_table = None
+
+
+def _load_workload(shm_name, n):
+    """Pool initializer: map the shared, arrival-sorted workload once."""
+    global _worker_table
+    shm = shared_memory.SharedMemory(name=shm_name)
+    table = ProcessTable.from_shared_memory(shm, n)
+    # Copy the inputs so the block can be released right away
+    _worker_table = ProcessTable(table.pid.copy(), table.arrival_time.copy(),
+                                 table.burst_time.copy(), table.priority.copy())
+    shm.close()
+
+
+def _run_shard(algo_fn, lo, hi, args, kwargs):
+    """Pool task: positions [lo, hi) of the sorted workload; returns a CachedRun (order local to the shard)."""
+    table = _worker_table
+    shard = ProcessTable(table.pid[lo:hi], table.arrival_time[lo:hi],
+                         table.burst_time[lo:hi], table.priority[lo:hi])
+    rows = [ProcessResult(spec) for spec in shard.to_specs()]
+    completed, schedule, stats = algo_fn(rows, *args, **kwargs)
+    return CachedRun.from_rows(rows, completed, schedule, stats)
+
+
+def _stitch(runs, bounds, order, burst_total, schedule_kind):
+    """Join shard runs (in time order) into one CachedRun over the original rows."""
+    run_order = np.concatenate([order[lo + run.order] for run, lo in zip(runs, bounds)])
+    completion = np.concatenate([run.completion for run in runs])
+    waiting = np.concatenate([run.waiting for run in runs])
+    turnaround = np.concatenate([run.turnaround for run in runs])
+    response = None
+    if all(run.response is not None for run in runs):
+        response = np.concatenate([run.response for run in runs])
+
+    if schedule_kind is None:
+        schedule = None
+    elif schedule_kind is Schedule:
+        schedule = Schedule.concatenate(run.schedule for run in runs)
+    else:
+        schedule = [row for run in runs for row in run.schedule]
+
+    # Same expressions as the schedulers: Python int sums, one division each
+    n = len(completion)
+    clock = int(completion.max())
+    idle_time = clock - burst_total
+    avg_waiting = int(waiting.sum()) / n
+    stats = {
+        "avg_waiting": avg_waiting,
+        "avg_turnaround": int(turnaround.sum()) / n,
+        # Schedulers that record no response time never pre-empt: response == waiting
+        "avg_response": int(response.sum()) / n if response is not None else avg_waiting,
+        "cpu_utilisation": 100 * (clock - idle_time) / clock if clock else 0,
+    }
+    return CachedRun(run_order, completion, waiting, turnaround, response, schedule, stats)
+
+
+def run_sharded(algo_fn, processes, *args, workers=None, min_processes=SHARD_MIN_PROCESSES, **kwargs):
+    """
+    Call `algo_fn(processes, *args, **kwargs)`, splitting the run at busy-period boundaries.
+
+    Returns exactly what the direct call returns. Falls back to the direct
+    call for small workloads, a single worker, a workload with no idle gap to
+    cut at, lazy iterators (which cannot be split ahead of time) and
+    instrumented runs.
+
+    Args:
+        algo_fn: Any scheduler from algorithms/ (a module-level function, so workers can load it)
+        processes: List of Process / ProcessSpec objects, or a ProcessTable
+        workers: Pool size (default: CPU count); 1 runs everything in this process
+        min_processes: Smallest workload worth sharding
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # The flags by name, whether they were passed by keyword or by position
+    flags = inspect.signature(algo_fn).bind(processes, *args, **kwargs).arguments
+    if (workers <= 1 or isinstance(processes, Iterator) or len(processes) < min_processes
+            or flags.get("instrument") is not None):
+        return algo_fn(processes, *args, **kwargs)
+
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_specs(processes)
+    order = np.argsort(table.arrival_time, kind="stable")
+    workload = ProcessTable(table.pid[order], table.arrival_time[order],
+                            table.burst_time[order], table.priority[order])
+    bounds = plan_shards(busy_period_starts(workload.arrival_time, workload.burst_time),
+                         len(workload), workers * SHARDS_PER_WORKER)
+    if len(bounds) <= 2:
+        return algo_fn(processes, *args, **kwargs)
+
+    shards = list(zip(bounds[:-1], bounds[1:]))
+    shm = workload.to_shared_memory()
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards)), initializer=_load_workload,
+                                 initargs=(shm.name, len(workload))) as pool:
+            futures = [pool.submit(_run_shard, algo_fn, lo, hi, args, kwargs) for lo, hi in shards]
+            runs = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    if flags.get("metrics_only"):
+        schedule_kind = None
+    elif flags.get("compress_rounds"):
+        schedule_kind = list
+    else:
+        schedule_kind = Schedule
+    run = _stitch(runs, bounds[:-1], order, int(workload.burst_time.sum()), schedule_kind)
+    return run.apply(processes)
+
+
+def sharded(algo_fn, workers=None, min_processes=SHARD_MIN_PROCESSES):
+    """
+    `algo_fn` with run_sharded applied; a drop-in replacement for the scheduler.
+
+    The wrapper keeps algo_fn's name and module, so the result cache files
+    sharded and sequential runs under the same key (their results are identical).
+    """
+    @functools.wraps(algo_fn)
+    def wrapper(processes, *args, **kwargs):
+        return run_sharded(algo_fn, processes, *args, workers=workers,
+                           min_processes=min_processes, **kwargs)
+    return wrapper
@@ -0,0 +1,28 @@
+# Regression tests for the shared scheduling kernel (algorithms/kernel.py)
+
+import pytest
+
+from algorithms.kernel import simulate
+from algorithms.priority_rr import PriorityRoundRobinPolicy
+from algorithms.round_robin import RoundRobinPolicy
+from process import Process
+
+
+def _segments(schedule):
+    return [(s["pid"], s["start"], s["finish"]) for s in schedule]
+
+
+# Every policy that exposes a rotation() to the round fast-forward
+@pytest.mark.parametrize("policy", [RoundRobinPolicy, PriorityRoundRobinPolicy])
+@pytest.mark.parametrize("compress_rounds", [False, True])
+def test_round_fast_forward_with_zero_burst(policy, compress_rounds):
+    # A finished (zero-burst) process in the rotation must not make the
+    # round fast-forward jump backwards in time
+    processes = [Process(1, 0, 0, 1), Process(2, 0, 9, 1), Process(3, 0, 9, 1), Process(4, 0, 9, 1)]
+    completed, schedule, stats = simulate(processes, policy(2), compress_rounds)
+
+    assert all(0 <= s["start"] <= s["finish"] for s in schedule)
+    if not compress_rounds:
+        assert _segments(schedule)[:4] == [(1, 0, 0), (2, 0, 2), (3, 2, 4), (4, 4, 6)]
+    assert stats["avg_waiting"] == 12.75
+    assert {p.pid: p.completion_time for p in completed} == {1: 0, 2: 25, 3: 26, 4: 27}
@@ -0,0 +1,108 @@
+# Regression tests for sharded simulation (sharded.py): a sharded run must
+# return exactly what the sequential run of the same scheduler returns
+
+import random
+
+import pytest
+
+from algorithms.fcfs import fcfs_schedule
+from algorithms.instrumentation import Instrumentation
+from algorithms.priority_non_preemptive import priority_schedule
+from algorithms.priority_preemptive import priority_preemptive_schedule
+from algorithms.priority_rr import priority_round_robin
+from algorithms.round_robin import round_robin
+from algorithms.sjf import sjf
+from process import Process
+from process_table import ProcessTable
+from sharded import run_sharded, sharded
+
+ALGORITHMS = [fcfs_schedule, sjf, priority_schedule, priority_preemptive_schedule,
+              round_robin, priority_round_robin]
+ROUND_ROBIN = [round_robin, priority_round_robin]
+
+
+def _workload(seed, n=300):
+    """Bursty arrivals (with idle gaps to cut at), some zero bursts and ties."""
+    rng = random.Random(seed)
+    processes, clock = [], 0
+    for pid in range(1, n + 1):
+        clock += rng.choice((0, 0, 1, 2, 40))
+        processes.append(Process(pid, clock, rng.randint(0, 9), rng.randint(0, 4)))
+    rng.shuffle(processes)
+    return processes
+
+
+def _fresh(processes, as_table):
+    if as_table:
+        return ProcessTable.from_processes(processes)
+    return [Process(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]
+
+
+def _results(completed):
+    if isinstance(completed, ProcessTable):
+        return (completed.pid.tolist(), completed.completion_time.tolist(),
+                completed.waiting_time.tolist(), completed.turnaround_time.tolist())
+    return [(p.pid, p.completion_time, p.waiting_time, p.turnaround_time,
+             getattr(p, "response_time", None))
+            for p in completed]
+
+
+def _schedule(schedule):
+    return None if schedule is None else list(schedule)
+
+
+def _assert_same(sharded_run, sequential_run):
+    completed, schedule, stats = sharded_run
+    expected_completed, expected_schedule, expected_stats = sequential_run
+    assert _results(completed) == _results(expected_completed)
+    assert type(schedule) is type(expected_schedule)
+    assert _schedule(schedule) == _schedule(expected_schedule)
+    assert stats == expected_stats
+
+
+@pytest.mark.parametrize("as_table", [False, True])
+@pytest.mark.parametrize("metrics_only", [False, True])
+@pytest.mark.parametrize("algo_fn", ALGORITHMS, ids=lambda fn: fn.__name__)
+def test_sharded_matches_sequential(algo_fn, metrics_only, as_table):
+    for seed in range(2):
+        processes = _workload(seed)
+        expected = algo_fn(_fresh(processes, as_table), metrics_only=metrics_only)
+        actual = run_sharded(algo_fn, _fresh(processes, as_table), metrics_only=metrics_only,
+                             workers=3, min_processes=1)
+        _assert_same(actual, expected)
+
+
+@pytest.mark.parametrize("as_table", [False, True])
+@pytest.mark.parametrize("algo_fn", ROUND_ROBIN, ids=lambda fn: fn.__name__)
+def test_sharded_compress_rounds(algo_fn, as_table):
+    processes = _workload(7)
+    expected = algo_fn(_fresh(processes, as_table), 3, compress_rounds=True)
+    actual = run_sharded(algo_fn, _fresh(processes, as_table), 3, compress_rounds=True,
+                         workers=3, min_processes=1)
+    _assert_same(actual, expected)
+
+
+@pytest.mark.parametrize("algo_fn", ROUND_ROBIN, ids=lambda fn: fn.__name__)
+def test_sharded_positional_flags(algo_fn):
+    # quantum, compress_rounds, metrics_only in positional order
+    processes = _workload(11)
+    for args in [(2, True), (2, False, True), (2, True, True)]:
+        expected = algo_fn(_fresh(processes, False), *args)
+        actual = sharded(algo_fn, workers=3, min_processes=1)(_fresh(processes, False), *args)
+        _assert_same(actual, expected)
+
+
+def test_sharded_positional_metrics_only():
+    processes = _workload(12)
+    expected = sjf(_fresh(processes, True), True)
+    _assert_same(run_sharded(sjf, _fresh(processes, True), True, workers=3, min_processes=1), expected)
+
+
+def test_positional_instrument_runs_sequentially():
+    # Instrumented runs are not sharded: the report must cover the whole run
+    report = Instrumentation()
+    processes = _workload(13)
+    expected = sjf(_fresh(processes, False))
+    _assert_same(run_sharded(sjf, _fresh(processes, False), False, report,
+                             workers=3, min_processes=1), expected)
+    assert report.admissions == len(processes)
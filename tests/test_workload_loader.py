@@ -0,0 +1,32 @@
+# Tests for workload_loader.load_records (the web form and JSON uploads)
+
+import json
+import os
+
+import pytest
+
+from workload_loader import WorkloadError, load_records
+
+UPLOADS = os.path.join(os.path.dirname(__file__), os.pardir, "FileToUpload")
+
+
+def test_records_without_pid_get_row_numbers():
+    with open(os.path.join(UPLOADS, "test_processes.json")) as f:
+        table = load_records(json.load(f), need_priority=True)
+    assert table.pid.tolist() == [1, 2, 3]
+    assert table.burst_time.tolist() == [5, 3, 4]
+    assert table.priority.tolist() == [3, 1, 2]
+
+
+def test_record_pids_are_kept():
+    table = load_records([{"pid": 7, "burst_time": 2}, {"pid": None, "burst_time": 3},
+                          {"burst_time": 4}])
+    assert table.pid.tolist() == [7, 2, 3]
+    assert table.arrival_time.tolist() == [0, 0, 0]
+
+
+def test_invalid_records_are_rejected():
+    with pytest.raises(WorkloadError, match="Row 2: burst_time must be positive"):
+        load_records([{"pid": 1, "burst_time": 2}, {"pid": 2, "burst_time": 0}])
+    with pytest.raises(WorkloadError, match="Row 1: pid is not a number"):
+        load_records([{"pid": "x", "burst_time": 2}])
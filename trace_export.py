@@ -0,0 +1,240 @@
+# Chrome Trace Export
+#
+# result.html draws one DOM node per schedule segment, which stops being usable
+# after a few thousand segments. This module streams a schedule to the Chrome
+# trace-event JSON format instead, which chrome://tracing and ui.perfetto.dev
+# open at millions of events. The trace has one track for the CPU, one track
+# per simulated process and a "ready_queue" counter track. Events are written
+# chunk by chunk as they are formatted, so the JSON text is never held in
+# memory; a path ending in .gz is written gzip-compressed.
+#
+# One simulated time unit is one microsecond on the trace timeline.
+#
+# Run from the repository root:
+#     python -m trace_export workload.csv -a round_robin -q 4 -o rr.json.gz
+
+import argparse
+import gzip
+import json
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from process_table import ProcessTable
+from schedule import Schedule
+from workload_loader import WorkloadError, load_workload
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Trace "processes" used as track groups
+CPU_TRACK = 0
+PROCESS_TRACKS = 1
+
+
+def _segment_chunks(schedule, chunk_size) -> Iterator[Tuple[np.ndarray, ...]]:
+    """(pid, start, finish, preempted) array blocks of a Schedule or an iterable of records."""
+    if isinstance(schedule, Schedule):
+        columns = schedule.to_numpy()
+        preempted = np.frombuffer(bytes(schedule.preempted), dtype=np.uint8)
+        for lo in range(0, len(schedule), chunk_size):
+            hi = lo + chunk_size
+            yield (columns["pid"][lo:hi], columns["start"][lo:hi],
+                   columns["finish"][lo:hi], preempted[lo:hi])
+        return
+
+    # Records, possibly compressed rounds ({'rounds', 'pids', 'start', 'finish'})
+    def rows():
+        for row in schedule:
+            if "rounds" not in row:
+                yield row["pid"], row["start"], row["finish"], row.get("turnaround", 0) is None
+                continue
+            quantum = (row["finish"] - row["start"]) // (row["rounds"] * len(row["pids"]))
+            clock = row["start"]
+            for _ in range(row["rounds"]):
+                for pid in row["pids"]:
+                    yield pid, clock, clock + quantum, False
+                    clock += quantum
+
+    rows = rows()
+    while True:
+        block = list(islice(rows, chunk_size))
+        if not block:
+            return
+        pid, start, finish, preempted = zip(*block)
+        yield (np.array(pid, dtype=np.int64), np.array(start, dtype=np.int64),
+               np.array(finish, dtype=np.int64), np.array(preempted, dtype=np.uint8))
+
+
+def _arrivals_and_completions(processes) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted arrival and completion times of scheduled processes."""
+    if isinstance(processes, ProcessTable):
+        arrival, completion = processes.arrival_time, processes.completion_time
+    else:
+        arrival = np.fromiter((p.arrival_time for p in processes), dtype=np.int64)
+        completion = np.fromiter((p.completion_time for p in processes), dtype=np.int64)
+    return np.sort(arrival), np.sort(completion)
+
+
+class _EventWriter:
+    """Appends pre-formatted events to the traceEvents array of an open file."""
+
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+
+    def write(self, events):
+        if not events:
+            return
+        self.f.write((",\n" if self.count else "\n") + ",\n".join(events))
+        self.count += len(events)
+
+
+def _metadata(kind, pid, tid, name):
+    return json.dumps({"ph": "M", "name": kind, "pid": pid, "tid": tid, "args": {"name": name}})
+
+
+def _ready_queue_counter(starts, finishes, lo, hi, arrival, completion, last):
+    """
+    Counter events for ready-queue length over [lo, hi), given this chunk's segments.
+
+    Ready = arrived - completed - running. The length can only change at an
+    arrival or a segment boundary; samples equal to the previous one (`last`)
+    are dropped. Returns (events, last value).
+    """
+    times = np.concatenate((starts, finishes,
+                            arrival[np.searchsorted(arrival, lo):np.searchsorted(arrival, hi)]))
+    times = np.unique(times[(times >= lo) & (times < hi)])
+    if not len(times):
+        return [], last
+    in_system = (np.searchsorted(arrival, times, side="right")
+                 - np.searchsorted(completion, times, side="right"))
+    covering = np.searchsorted(starts, times, side="right") - 1
+    running = (covering >= 0) & (times < finishes[np.maximum(covering, 0)])
+    ready = in_system - running
+
+    keep = np.empty(len(ready), dtype=bool)
+    keep[0] = ready[0] != last
+    keep[1:] = ready[1:] != ready[:-1]
+    events = [f'{{"ph":"C","name":"ready_queue","pid":{CPU_TRACK},"ts":{t},"args":{{"length":{v}}}}}'
+              for t, v in zip(times[keep].tolist(), ready[keep].tolist())]
+    return events, int(ready[-1])
+
+
+def write_chrome_trace(path, schedule, processes=None, per_process: bool = True,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream `schedule` to a Chrome trace-event JSON file.
+
+    Args:
+        path: Output file (a name ending in .gz is gzip-compressed) or an open text file
+        schedule: Schedule, or records as returned by a scheduler (compressed
+            rounds are expanded on the fly)
+        processes: The scheduled processes (list or ProcessTable); needed for
+            the ready_queue counter track, which is omitted without them
+        per_process: Also draw each process's segments on its own track
+        chunk_size: Segments formatted per write
+
+    Returns:
+        Number of trace events written
+    """
+    if isinstance(path, str):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "wt") as f:
+            return write_chrome_trace(f, schedule, processes, per_process, chunk_size)
+
+    f = path
+    f.write('{"displayTimeUnit":"ms","otherData":{"time_unit":"1 simulated unit = 1 us"},"traceEvents":[')
+    writer = _EventWriter(f)
+    writer.write([
+        _metadata("process_name", CPU_TRACK, 0, "CPU"),
+        _metadata("thread_name", CPU_TRACK, 0, "CPU 0"),
+        _metadata("process_name", PROCESS_TRACKS, 0, "Processes"),
+    ])
+
+    if processes is not None:
+        arrival, completion = _arrivals_and_completions(processes)
+        pids = processes.pid if isinstance(processes, ProcessTable) else [p.pid for p in processes]
+        if per_process:
+            pids = np.sort(np.asarray(pids, dtype=np.int64)).tolist()
+            for lo in range(0, len(pids), chunk_size):
+                writer.write([_metadata("thread_name", PROCESS_TRACKS, pid, f"P{pid}")
+                              for pid in pids[lo:lo + chunk_size]])
+    seen_pids = set()
+    ready = 0
+    lo = 0
+
+    chunks = _segment_chunks(schedule, chunk_size)
+    chunk = next(chunks, None)
+    while chunk is not None:
+        following = next(chunks, None)
+        pid, start, finish, preempted = chunk
+        rows = list(zip(pid.tolist(), start.tolist(), (finish - start).tolist(), preempted.tolist()))
+        writer.write([
+            f'{{"ph":"X","name":"P{p}","pid":{CPU_TRACK},"tid":0,"ts":{s},"dur":{d}'
+            + (',"args":{"preempted":true}}' if cut else "}")
+            for p, s, d, cut in rows])
+        if per_process:
+            writer.write([
+                f'{{"ph":"X","name":"run","pid":{PROCESS_TRACKS},"tid":{p},"ts":{s},"dur":{d}'
+                + (',"args":{"preempted":true}}' if cut else "}")
+                for p, s, d, cut in rows])
+            if processes is None:
+                new = set(pid.tolist()) - seen_pids
+                seen_pids |= new
+                writer.write([_metadata("thread_name", PROCESS_TRACKS, p, f"P{p}") for p in sorted(new)])
+
+        if processes is not None and len(start):
+            # This chunk owns the time range up to the next chunk's first segment
+            hi = int(following[1][0]) if following is not None and len(following[1]) else np.iinfo(np.int64).max
+            events, ready = _ready_queue_counter(start, finish, lo, hi, arrival, completion, ready)
+            writer.write(events)
+            lo = hi
+        chunk = following
+
+    f.write("\n]}\n")
+    return writer.count
+
+
+# ---------------- CLI ----------------
+
+def _algorithms(quantum):
+    from algorithms.fcfs import fcfs_schedule
+    from algorithms.sjf import sjf
+    from algorithms.round_robin import round_robin
+    from algorithms.priority_non_preemptive import priority_schedule
+    from algorithms.priority_preemptive import priority_preemptive_schedule
+    from algorithms.priority_rr import priority_round_robin
+    return {
+        "fcfs_schedule": lambda procs: fcfs_schedule(procs),
+        "sjf": lambda procs: sjf(procs),
+        "round_robin": lambda procs: round_robin(procs, quantum),
+        "priority_schedule": lambda procs: priority_schedule(procs),
+        "priority_preemptive_schedule": lambda procs: priority_preemptive_schedule(procs),
+        "priority_round_robin": lambda procs: priority_round_robin(procs, quantum),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule a workload and write a Chrome/Perfetto trace")
+    parser.add_argument("workload", help="CSV or Excel file with arrival_time, burst_time[, priority] "
+                                         "(PIDs follow the row order, see workload_loader)")
+    parser.add_argument("-a", "--algorithm", default="round_robin",
+                        choices=list(_algorithms(None)))
+    parser.add_argument("-q", "--quantum", type=int, default=4)
+    parser.add_argument("-o", "--output", default="trace.json", help="trace file (.json or .json.gz)")
+    parser.add_argument("--no-process-tracks", action="store_true",
+                        help="only the CPU and ready-queue tracks (smaller file)")
+    args = parser.parse_args()
+
+    try:
+        processes, _ = load_workload(args.workload, need_priority="priority" in args.algorithm)
+    except (WorkloadError, OSError) as e:
+        parser.error(str(e))
+    processes, schedule, _ = _algorithms(args.quantum)[args.algorithm](processes)
+    events = write_chrome_trace(args.output, schedule, processes, per_process=not args.no_process_tracks)
+    print(f"Wrote {events} trace events ({len(schedule)} segments) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
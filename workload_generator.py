@@ -0,0 +1,302 @@
+# Synthetic Workload Generator
+#
+# Builds large, reproducible workloads for stress-testing the schedulers.
+# A WorkloadGenerator combines an arrival process (Poisson, bursty MMPP or
+# diurnal), a burst-time distribution (exponential, log-normal or Pareto) and
+# a priority mix. Processes are produced lazily, in arrival order, one NumPy
+# chunk at a time, so a workload can be streamed to a CSV file or straight
+# into a scheduler without ever holding the full list.
+#
+# Write 10^8 processes to disk (run from the repo root):
+#     python -m workload_generator -n 100000000 -o big.csv --arrival bursty --burst pareto
+#
+# Feed a scheduler directly:
+#     gen = WorkloadGenerator(PoissonArrivals(0.1), ExponentialBursts(8), n=10**6, seed=1)
+#     completed, _, stats = round_robin(iter(gen), 4, metrics_only=True)
+
+import argparse
+import math
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from process import ProcessSpec
+from process_table import ProcessTable
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+# ---------------- arrival processes ----------------
+# Each one turns a random generator into an endless stream of float arrival
+# times (nondecreasing), yielded as NumPy arrays of roughly `size` entries.
+
+class PoissonArrivals:
+    """Homogeneous Poisson arrivals: exponential gaps with mean 1 / rate."""
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("Arrival rate must be positive")
+        self.rate = rate
+
+    def times(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        clock = 0.0
+        while True:
+            times = clock + np.cumsum(rng.exponential(1 / self.rate, size))
+            clock = times[-1]
+            yield times
+
+
+class BurstyArrivals:
+    """
+    Markov-modulated Poisson process (MMPP): the source cycles through states,
+    staying in state i for an exponential time with mean 1 / switch_rates[i]
+    and emitting Poisson arrivals at rates[i] meanwhile.
+    """
+
+    def __init__(self, rates=(0.05, 2.0), switch_rates=(0.001, 0.01)):
+        if len(rates) != len(switch_rates) or not rates:
+            raise ValueError("Need one switch rate per state")
+        if min(rates) < 0 or max(rates) <= 0 or min(switch_rates) <= 0:
+            raise ValueError("Rates must be non-negative (not all zero) and switch rates positive")
+        self.rates = tuple(rates)
+        self.switch_rates = tuple(switch_rates)
+
+    def times(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        clock = 0.0
+        state = 0
+        pending = []
+        count = 0
+        while True:
+            stay = rng.exponential(1 / self.switch_rates[state])
+            # Given their number, Poisson arrivals in an interval are uniform
+            k = rng.poisson(self.rates[state] * stay)
+            if k:
+                pending.append(clock + np.sort(rng.uniform(0, stay, k)))
+                count += k
+            clock += stay
+            state = (state + 1) % len(self.rates)
+            if count >= size:
+                yield np.concatenate(pending)
+                pending = []
+                count = 0
+
+
+class DiurnalArrivals:
+    """
+    Poisson arrivals whose rate follows a daily cycle:
+    rate(t) = rate * (1 + amplitude * sin(2 pi t / period)), drawn by thinning.
+    """
+
+    def __init__(self, rate: float, period: float = 86_400, amplitude: float = 0.8):
+        if rate <= 0 or period <= 0 or not 0 <= amplitude <= 1:
+            raise ValueError("Need rate > 0, period > 0 and 0 <= amplitude <= 1")
+        self.rate = rate
+        self.period = period
+        self.amplitude = amplitude
+
+    def times(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        peak = self.rate * (1 + self.amplitude)
+        clock = 0.0
+        while True:
+            candidates = clock + np.cumsum(rng.exponential(1 / peak, size))
+            clock = candidates[-1]
+            rate = self.rate * (1 + self.amplitude * np.sin(2 * np.pi * candidates / self.period))
+            yield candidates[rng.random(size) * peak < rate]
+
+
+class SimultaneousArrivals:
+    """Every process arrives at time 0."""
+
+    def times(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        zeros = np.zeros(size)
+        while True:
+            yield zeros
+
+
+# ---------------- burst-time distributions ----------------
+# sample(rng, size) returns int64 burst times >= 1.
+
+def _to_bursts(values: np.ndarray, max_burst: Optional[int]) -> np.ndarray:
+    bursts = np.maximum(np.ceil(values), 1)
+    if max_burst is not None:
+        bursts = np.minimum(bursts, max_burst)
+    return bursts.astype(np.int64)
+
+
+class ExponentialBursts:
+    """Exponentially distributed bursts with the given mean."""
+
+    def __init__(self, mean: float, max_burst: Optional[int] = None):
+        self.mean = mean
+        self.max_burst = max_burst
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return _to_bursts(rng.exponential(self.mean, size), self.max_burst)
+
+
+class LogNormalBursts:
+    """Log-normal bursts with the given mean; sigma is the spread of log(burst)."""
+
+    def __init__(self, mean: float, sigma: float = 1.0, max_burst: Optional[int] = None):
+        self.mu = math.log(mean) - sigma ** 2 / 2
+        self.sigma = sigma
+        self.max_burst = max_burst
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return _to_bursts(rng.lognormal(self.mu, self.sigma, size), self.max_burst)
+
+
+class ParetoBursts:
+    """Heavy-tailed Pareto bursts: P(burst > x) = (minimum / x) ** alpha."""
+
+    def __init__(self, alpha: float = 1.5, minimum: float = 1.0, max_burst: Optional[int] = None):
+        self.alpha = alpha
+        self.minimum = minimum
+        self.max_burst = max_burst
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        # NumPy's pareto() is the Lomax form: shift it back to start at `minimum`
+        return _to_bursts(self.minimum * (1 + rng.pareto(self.alpha, size)), self.max_burst)
+
+
+# ---------------- priorities ----------------
+
+class PriorityMix:
+    """Priorities drawn from {priority: weight}; the default is all 0."""
+
+    def __init__(self, weights: Optional[Dict[int, float]] = None):
+        weights = weights or {0: 1.0}
+        self.levels = np.array(list(weights), dtype=np.int64)
+        p = np.array(list(weights.values()), dtype=float)
+        self.p = p / p.sum()
+
+    @classmethod
+    def uniform(cls, levels: int) -> "PriorityMix":
+        """Priorities 0 .. levels-1, equally likely."""
+        return cls({level: 1.0 for level in range(levels)})
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if len(self.levels) == 1:
+            return np.full(size, self.levels[0], dtype=np.int64)
+        return rng.choice(self.levels, size, p=self.p)
+
+
+# ---------------- generator ----------------
+
+class WorkloadGenerator:
+    """
+    Seeded, lazily generated workload in arrival order.
+
+    Iterating yields ProcessSpec entries (pids 1, 2, ...); chunks() yields
+    the same workload as ProcessTable blocks. Every pass starts again from the
+    seed, so the workload is identical each time. Arrivals, bursts and
+    priorities use independent random streams: changing the burst
+    distribution leaves arrival times untouched.
+    """
+
+    def __init__(self, arrivals, bursts, priorities: Optional[PriorityMix] = None,
+                 n: Optional[int] = None, seed: int = 0, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            arrivals: PoissonArrivals, BurstyArrivals, DiurnalArrivals or SimultaneousArrivals
+            bursts: ExponentialBursts, LogNormalBursts or ParetoBursts
+            priorities: PriorityMix (default: every process at priority 0)
+            n: Number of processes, or None for an endless stream
+            seed: Seed of every random stream
+            chunk_size: Processes generated per NumPy step
+        """
+        self.arrivals = arrivals
+        self.bursts = bursts
+        self.priorities = priorities or PriorityMix()
+        self.n = n
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+    def chunks(self) -> Iterator[ProcessTable]:
+        """The workload as consecutive ProcessTable blocks."""
+        arrival_rng, burst_rng, priority_rng = (
+            np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(3))
+        produced = 0
+        for times in self.arrivals.times(arrival_rng, self.chunk_size):
+            if self.n is not None:
+                times = times[:self.n - produced]
+            size = len(times)
+            if size:
+                yield ProcessTable(
+                    np.arange(produced + 1, produced + size + 1, dtype=np.int64),
+                    np.floor(times).astype(np.int64),
+                    self.bursts.sample(burst_rng, size),
+                    self.priorities.sample(priority_rng, size),
+                )
+                produced += size
+            if self.n is not None and produced >= self.n:
+                return
+
+    def __iter__(self) -> Iterator[ProcessSpec]:
+        for chunk in self.chunks():
+            yield from chunk.to_specs()
+
+    def table(self) -> ProcessTable:
+        """The whole (finite) workload as one ProcessTable."""
+        if self.n is None:
+            raise ValueError("An endless workload cannot be materialized")
+        chunks = list(self.chunks())
+        if not chunks:
+            return ProcessTable([], [], [])
+        return ProcessTable(*(np.concatenate([getattr(c, name) for c in chunks])
+                              for name in ("pid", "arrival_time", "burst_time", "priority")))
+
+    def write_csv(self, path: str) -> int:
+        """
+        Stream the (finite) workload to a CSV file in the FileToUpload format
+        (pid, arrival_time, burst_time, priority). Returns the row count.
+        """
+        if self.n is None:
+            raise ValueError("An endless workload cannot be written to a file")
+        written = 0
+        with open(path, "w") as f:
+            f.write("pid,arrival_time,burst_time,priority\n")
+            for chunk in self.chunks():
+                rows = np.column_stack((chunk.pid, chunk.arrival_time, chunk.burst_time, chunk.priority))
+                np.savetxt(f, rows, fmt="%d", delimiter=",")
+                written += len(chunk)
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic workload as CSV")
+    parser.add_argument("-n", type=int, required=True, help="number of processes")
+    parser.add_argument("-o", "--output", required=True, help="CSV file to write")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival", choices=["poisson", "bursty", "diurnal", "zero"], default="poisson")
+    parser.add_argument("--rate", type=float, default=0.1, help="mean arrivals per time unit")
+    parser.add_argument("--burst", choices=["exponential", "lognormal", "pareto"], default="exponential")
+    parser.add_argument("--mean-burst", type=float, default=8.0)
+    parser.add_argument("--sigma", type=float, default=1.0, help="log-normal spread")
+    parser.add_argument("--alpha", type=float, default=1.5, help="Pareto tail index")
+    parser.add_argument("--max-burst", type=int, default=None)
+    parser.add_argument("--priorities", type=int, default=1, help="number of equally likely levels")
+    args = parser.parse_args()
+
+    arrivals = {
+        "poisson": lambda: PoissonArrivals(args.rate),
+        # Quiet and busy phases averaging out near --rate
+        "bursty": lambda: BurstyArrivals((args.rate / 4, args.rate * 7 / 4), (args.rate / 200,) * 2),
+        "diurnal": lambda: DiurnalArrivals(args.rate),
+        "zero": lambda: SimultaneousArrivals(),
+    }[args.arrival]()
+    bursts = {
+        "exponential": lambda: ExponentialBursts(args.mean_burst, args.max_burst),
+        "lognormal": lambda: LogNormalBursts(args.mean_burst, args.sigma, args.max_burst),
+        "pareto": lambda: ParetoBursts(args.alpha, args.mean_burst * (args.alpha - 1) / args.alpha
+                                       if args.alpha > 1 else 1.0, args.max_burst),
+    }[args.burst]()
+
+    generator = WorkloadGenerator(arrivals, bursts, PriorityMix.uniform(args.priorities),
+                                  n=args.n, seed=args.seed)
+    written = generator.write_csv(args.output)
+    print(f"Wrote {written} processes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# Server-side Workload Store
+#
+# The web interface used to carry the whole workload as JSON in the Flask
+# session cookie, which browsers cap at about 4 KB. WorkloadStore keeps
+# workloads on the server instead, under their content hash (the same
+# workload_digest the result cache uses), and the session only holds that id.
+# Storing the same workload twice is free, so an upload is parsed once and
+# then reused by every run. Recent workloads stay in a byte-bounded in-memory
+# LRU; the least recently used ones spill to a directory, from which get()
+# brings them back.
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+from process_table import ProcessTable
+from result_cache import DISK_TRIM_TARGET, workload_digest
+
+# Set SCHEDULER_WORKLOAD_DIR to move the spill directory, or to "" to turn it off
+DEFAULT_WORKLOAD_DIR = os.environ.get(
+    "SCHEDULER_WORKLOAD_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "cpu_scheduler", "workloads")) or None
+
+
+class WorkloadStore:
+    """
+    Content-addressed workloads: in-memory LRU that spills to disk.
+
+    Each workload is kept as one read-only (4, n) int64 array of pid,
+    arrival_time, burst_time and priority. Counters: hits (memory),
+    disk_hits, misses and spills.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, directory: Optional[str] = DEFAULT_WORKLOAD_DIR,
+                 max_disk_bytes: int = 2**30):
+        """
+        Args:
+            max_bytes: Budget of the in-memory tier (least recently used workloads spill first)
+            directory: Where spilled workloads go; None drops them instead
+            max_disk_bytes: Budget of the spill directory (oldest files go first)
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_bytes = None      # Size of the spill directory, measured on the first spill
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.spills = 0
+
+    def counters(self) -> Dict[str, int]:
+        """Hit/miss/spill counters and the current size of the memory tier."""
+        with self._lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "spills": self.spills, "entries": len(self._entries), "bytes": self._bytes}
+
+    # ---------------- store / lookup ----------------
+    def put(self, processes) -> str:
+        """
+        Store a workload (ProcessTable, or Process / ProcessSpec objects) and
+        return its id. Only the input fields are kept; row order is preserved.
+        """
+        if not isinstance(processes, ProcessTable):
+            processes = ProcessTable.from_specs(processes)
+        workload_id = workload_digest(processes)
+        with self._lock:
+            if workload_id in self._entries:
+                self._entries.move_to_end(workload_id)
+                return workload_id
+        columns = np.stack((processes.pid, processes.arrival_time,
+                            processes.burst_time, processes.priority))
+        columns.flags.writeable = False
+        with self._lock:
+            self._remember(workload_id, columns)
+        return workload_id
+
+    def get(self, workload_id: str) -> ProcessTable:
+        """A fresh (unscheduled) ProcessTable of the workload. Raises KeyError if unknown."""
+        with self._lock:
+            columns = self._entries.get(workload_id)
+            if columns is not None:
+                self._entries.move_to_end(workload_id)
+                self.hits += 1
+                return ProcessTable(*columns)
+
+        columns = self._read(workload_id)
+        with self._lock:
+            if columns is None:
+                self.misses += 1
+                raise KeyError(f"Unknown workload {workload_id}")
+            self.disk_hits += 1
+            self._remember(workload_id, columns)
+        return ProcessTable(*columns)
+
+    def __contains__(self, workload_id) -> bool:
+        with self._lock:
+            if workload_id in self._entries:
+                return True
+        return self._path(workload_id) is not None and os.path.exists(self._path(workload_id))
+
+    # ---------------- tiers ----------------
+    def _remember(self, workload_id, columns):
+        """Insert into the memory tier and spill down to max_bytes (lock held)."""
+        old = self._entries.pop(workload_id, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        self._entries[workload_id] = columns
+        self._bytes += columns.nbytes
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            evicted_id, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self._write(evicted_id, evicted)
+        if self._bytes > self.max_bytes and self.directory is not None:
+            # A single workload over budget goes straight to disk
+            self._entries.popitem()
+            self._bytes -= columns.nbytes
+            self._write(workload_id, columns)
+
+    def _path(self, workload_id) -> Optional[str]:
+        # Ids come from requests: only well-formed digests map to a file
+        if (self.directory is None or not isinstance(workload_id, str) or len(workload_id) != 64
+                or not all(c in "0123456789abcdef" for c in workload_id)):
+            return None
+        return os.path.join(self.directory, workload_id[:2], workload_id + ".npy")
+
+    def _read(self, workload_id) -> Optional[np.ndarray]:
+        path = self._path(workload_id)
+        if path is None:
+            return None
+        try:
+            columns = np.load(path, allow_pickle=False)
+            os.utime(path)   # recently used files are deleted last
+        except (OSError, ValueError):
+            return None
+        columns.flags.writeable = False
+        return columns
+
+    def _write(self, workload_id, columns):
+        path = self._path(workload_id)
+        if path is None:
+            return
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    np.save(f, columns, allow_pickle=False)
+                os.replace(tmp, path)
+                self._wrote(os.path.getsize(path))
+            self.spills += 1
+        except OSError:
+            pass   # the spill is best effort; the workload is then forgotten
+
+    def _scan_disk(self):
+        """(mtime, size, path) of every spilled workload file."""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".npy"):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue   # removed by another process meanwhile
+                    files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def _wrote(self, size):
+        """Add a new file to the running size of the spill directory and trim it once over budget (lock held)."""
+        if self._disk_bytes is None:
+            # First spill of this session: measure what earlier ones left (includes this file)
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+        else:
+            self._disk_bytes += size
+        if self._disk_bytes > self.max_disk_bytes:
+            self._trim_disk()
+
+    def _trim_disk(self):
+        """
+        Delete the least recently used files until the directory is down to
+        DISK_TRIM_TARGET of max_disk_bytes (as the result cache does), then
+        re-measure the running size (other processes spill too).
+        """
+        files = self._scan_disk()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= DISK_TRIM_TARGET * self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._disk_bytes = total
+
+# Shared by the web interface
+workload_store = WorkloadStore()